@@ -75,6 +75,7 @@ ENERGY = {**OIL_GAS, **PIPELINES}
 
 ALL_STOCKS = {**BANKS, **OIL_GAS, **PIPELINES, **UTILITIES, **TECH, **RAILS, **TELECOM, **MINING, **OTHER}
 TICKERS = list(ALL_STOCKS.keys())
+TICKER_LABELS = {t: f"{t} — {name}" for t, name in ALL_STOCKS.items()}
 
 SECTORS = {}
 for t in BANKS:
@@ -108,6 +109,7 @@ SECTOR_GROUPS = [
     ("Other", OTHER),
 ]
 SECTOR_NAMES = [name for name, _ in SECTOR_GROUPS]
+SECTOR_TO_TICKERS = {name: list(group) for name, group in SECTOR_GROUPS}
 
 # ── US AI Stock Universe ──────────────────────────────────────────────────────
 # Prices remain in USD — no currency conversion applied.
@@ -202,6 +204,7 @@ AI_ALL_STOCKS = {
 }
 
 AI_TICKERS = list(AI_ALL_STOCKS.keys())
+AI_TICKER_LABELS = {t: f"{t} — {name}" for t, name in AI_ALL_STOCKS.items()}
 
 AI_SECTORS = {}
 for t in AI_SEMICONDUCTORS:
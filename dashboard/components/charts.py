@@ -6,6 +6,39 @@ import pandas as pd
 import numpy as np
 
 
+LTTB_MAX_POINTS = 2000
+
+
+def downsample_lttb(x, y, n_out: int = LTTB_MAX_POINTS) -> tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets downsampling of a line series to at most n_out points.
+
+    Keeps the first and last points and, per bucket, the point forming the largest
+    triangle with the previously kept point and the next bucket's average. Series
+    already within n_out points are returned unchanged (as arrays).
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    xf = x.astype("datetime64[ns]").astype("int64") if x.dtype.kind == "M" else x
+    xf = xf.astype(float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x, avg_y = xf[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((xf[a] - avg_x) * (y[lo:hi] - y[a]) - (xf[a] - xf[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+
 def create_candlestick_chart(
     prices: pd.DataFrame,
     indicators: pd.DataFrame = None,
@@ -228,7 +261,7 @@ def create_sector_comparison(perf_df: pd.DataFrame, metric: str = "total_return"
     perf_df = perf_df.copy()
     perf_df["sector"] = perf_df["ticker"].map(SECTORS)
 
-    sector_avg = perf_df.groupby("sector")[metric].mean().sort_values(ascending=False)
+    sector_avg = perf_df.groupby("sector", observed=True)[metric].mean().sort_values(ascending=False)
 
     colors = {
         "Banks": "#2196f3", "Oil & Gas": "#ff9800", "Pipelines": "#ff5722",
@@ -254,26 +287,34 @@ def create_sector_comparison(perf_df: pd.DataFrame, metric: str = "total_return"
     return fig
 
 
-def create_correlation_heatmap(prices_dict: dict[str, pd.Series], height: int = 500) -> go.Figure:
-    """Create price correlation matrix heatmap from dict of ticker -> close price series."""
-    if not prices_dict:
+def _pearson_matrix(x: np.ndarray) -> np.ndarray:
+    """Pearson correlation of the columns of a NaN-free matrix as one BLAS product."""
+    n = x.shape[0]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = (x - x.mean(axis=0)) / x.std(axis=0, ddof=1)
+        corr = (z.T @ z) / (n - 1)
+    return np.clip(corr, -1.0, 1.0)
+
+
+def create_correlation_heatmap(closes: pd.DataFrame, height: int = 500) -> go.Figure:
+    """Create price correlation matrix heatmap from a wide close-price frame (date x ticker)."""
+    if closes.empty:
         fig = go.Figure()
         fig.update_layout(title="Correlation (No data)", height=height, template="plotly_white",
                           paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)")
         return fig
 
-    df = pd.DataFrame(prices_dict)
     # Use returns for correlation
-    returns = df.pct_change().dropna()
-    corr = returns.corr()
+    returns = closes.pct_change().dropna()
+    corr = _pearson_matrix(returns.to_numpy(dtype=float))
 
     fig = go.Figure(data=go.Heatmap(
-        z=corr.values,
-        x=corr.columns,
-        y=corr.index,
+        z=corr,
+        x=returns.columns,
+        y=returns.columns,
         colorscale="RdBu_r",
         zmin=-1, zmax=1,
-        text=np.round(corr.values, 2),
+        text=np.round(corr, 2),
         texttemplate="%{text}",
         textfont=dict(size=9),
     ))
@@ -3,9 +3,8 @@
 import streamlit as st
 
 
-def apply_custom_css():
-    """Inject custom CSS for a cohesive light-themed financial dashboard."""
-    st.markdown("""
+# Shared stylesheet injected at the top of every page
+CUSTOM_CSS = """
     <style>
     /* --- Metric cards --- */
     div[data-testid="stMetric"] {
@@ -48,4 +47,9 @@ def apply_custom_css():
         border-radius: 8px;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+
+def apply_custom_css():
+    """Inject custom CSS for a cohesive light-themed financial dashboard."""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
@@ -1,6 +1,8 @@
 """Table styling helpers for the Streamlit dashboard."""
 
+import numpy as np
 import pandas as pd
+import streamlit as st
 
 
 def style_rsi(val) -> str:
@@ -34,6 +36,12 @@ def style_return(val) -> str:
     return ""
 
 
+def style_return_column(col: pd.Series) -> np.ndarray:
+    """Column-wise style_return for Styler.apply: one CSS string per row."""
+    vals = pd.to_numeric(col, errors="coerce").to_numpy(dtype=float)
+    return np.where(vals > 0, "color: #26a69a", np.where(vals < 0, "color: #ef5350", ""))
+
+
 def style_macd_status(val) -> str:
     """Color-code MACD status text."""
     if "Bullish" in str(val):
@@ -79,3 +87,33 @@ def get_vwap_position(close: float, vwap: float) -> str:
     if pd.isna(vwap) or pd.isna(close):
         return "—"
     return "Above" if close > vwap else "Below"
+
+
+PAGE_SIZES = [100, 200, 500]
+
+
+def paginate(df: pd.DataFrame, key: str, page_size: int = 200) -> pd.DataFrame:
+    """Render page controls for a large table and return only the visible rows.
+
+    Styling and serializing just the current page keeps big tables responsive;
+    the full table stays available as a CSV download.
+    """
+    if len(df) <= page_size:
+        return df
+
+    col_size, col_page, col_dl = st.columns([1, 1, 2])
+    page_size = col_size.selectbox(
+        "Rows per page", PAGE_SIZES, index=PAGE_SIZES.index(page_size), key=f"{key}_size",
+    )
+    n_pages = -(-len(df) // page_size)
+    page = col_page.number_input(
+        f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1, key=f"{key}_page",
+    )
+    col_dl.download_button(
+        "Download full table (CSV)", df.to_csv(index=False),
+        file_name=f"{key}.csv", mime="text/csv", key=f"{key}_csv",
+    )
+
+    start = (page - 1) * page_size
+    st.caption(f"Rows {start + 1:,}–{min(start + page_size, len(df)):,} of {len(df):,}")
+    return df.iloc[start:start + page_size]
@@ -162,14 +162,17 @@ def init_db():
 
 def store_prices(ticker: str, df: pd.DataFrame):
     """Store OHLCV data. Upserts on (ticker, date)."""
+    ohlcv = df[["Open", "High", "Low", "Close", "Volume"]]
+    rows = [
+        (ticker, date.strftime("%Y-%m-%d"), open_, high, low, close, int(volume))
+        for date, open_, high, low, close, volume in ohlcv.itertuples(index=True, name=None)
+    ]
     with get_connection() as conn:
-        for date, row in df.iterrows():
-            conn.execute(
-                "INSERT OR REPLACE INTO stock_prices (ticker, date, open, high, low, close, volume) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?)",
-                (ticker, date.strftime("%Y-%m-%d"), row["Open"], row["High"],
-                 row["Low"], row["Close"], int(row["Volume"])),
-            )
+        conn.executemany(
+            "INSERT OR REPLACE INTO stock_prices (ticker, date, open, high, low, close, volume) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
 
 
 def store_indicators(ticker: str, df: pd.DataFrame):
@@ -195,25 +198,29 @@ def store_indicators(ticker: str, df: pd.DataFrame):
         f"INSERT OR REPLACE INTO indicators (ticker, date, {col_names}) "
         f"VALUES ({placeholders})"
     )
+    # Missing indicator columns are stored as NULL, like NaN values
+    values = df.reindex(columns=list(col_map))
+    rows = [
+        (ticker, date.strftime("%Y-%m-%d"), *[None if pd.isna(v) else float(v) for v in row])
+        for date, *row in values.itertuples(index=True, name=None)
+    ]
     with get_connection() as conn:
-        for date, row in df.iterrows():
-            values = {db_col: row.get(src_col) for src_col, db_col in col_map.items()}
-            values = {k: (None if pd.isna(v) else float(v)) for k, v in values.items()}
-            conn.execute(sql, (ticker, date.strftime("%Y-%m-%d"),
-                               *[values[c] for c in columns]))
+        conn.executemany(sql, rows)
 
 
 def store_signals(signals: list[dict]):
     """Store signal dicts with keys: ticker, date, signal_type, direction, price, strategy."""
+    rows = [
+        (s["ticker"], s["date"].strftime("%Y-%m-%d") if hasattr(s["date"], "strftime") else s["date"],
+         s["signal_type"], s["direction"], s.get("price"), s.get("strategy"))
+        for s in signals
+    ]
     with get_connection() as conn:
-        for s in signals:
-            date_str = s["date"].strftime("%Y-%m-%d") if hasattr(s["date"], "strftime") else s["date"]
-            conn.execute(
-                "INSERT OR REPLACE INTO signals (ticker, date, signal_type, direction, price, strategy) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
-                (s["ticker"], date_str, s["signal_type"], s["direction"],
-                 s.get("price"), s.get("strategy")),
-            )
+        conn.executemany(
+            "INSERT OR REPLACE INTO signals (ticker, date, signal_type, direction, price, strategy) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
 
 
 def store_trades(ticker: str, strategy: str, trades: list):
@@ -254,21 +261,38 @@ def store_performance(ticker: str, strategy: str, result):
 
 # --- Query methods ---
 
-def get_prices(ticker: str = None) -> pd.DataFrame:
-    """Get price data. If ticker is None, get all."""
+def get_prices(ticker: str = None, columns: list[str] = None) -> pd.DataFrame:
+    """Get price data. If ticker is None, get all. Optionally read only `columns`."""
+    select = ", ".join(columns) if columns else "*"
     with get_connection() as conn:
         if ticker:
             df = pd.read_sql_query(
-                "SELECT * FROM stock_prices WHERE ticker = ? ORDER BY date",
+                f"SELECT {select} FROM stock_prices WHERE ticker = ? ORDER BY date",
                 conn, params=(ticker,),
             )
         else:
-            df = pd.read_sql_query("SELECT * FROM stock_prices ORDER BY ticker, date", conn)
-    if not df.empty:
+            df = pd.read_sql_query(f"SELECT {select} FROM stock_prices ORDER BY ticker, date", conn)
+    if not df.empty and "date" in df:
         df["date"] = pd.to_datetime(df["date"])
     return df
 
 
+def get_prices_bulk(tickers: list[str]) -> dict[str, pd.DataFrame]:
+    """Get price data for several tickers in one query, keyed by ticker (missing tickers omitted)."""
+    if not tickers:
+        return {}
+    placeholders = ", ".join(["?"] * len(tickers))
+    with get_connection() as conn:
+        df = pd.read_sql_query(
+            f"SELECT * FROM stock_prices WHERE ticker IN ({placeholders}) ORDER BY ticker, date",
+            conn, params=list(tickers),
+        )
+    if df.empty:
+        return {}
+    df["date"] = pd.to_datetime(df["date"])
+    return {t: g.reset_index(drop=True) for t, g in df.groupby("ticker", sort=False)}
+
+
 def get_indicators(ticker: str = None) -> pd.DataFrame:
     with get_connection() as conn:
         if ticker:
@@ -1,8 +1,9 @@
 """Volume-based indicators."""
 
+import numpy as np
 import pandas as pd
 
-from config import VWAP_LOOKBACK
+from config import VWAP_LOOKBACK, OBV_EMA_PERIOD
 
 
 def calculate_vwap(df: pd.DataFrame) -> pd.DataFrame:
@@ -24,6 +25,11 @@ def calculate_vwap(df: pd.DataFrame) -> pd.DataFrame:
 
 def calculate_obv(df: pd.DataFrame) -> pd.DataFrame:
     """On-Balance Volume — cumulative volume weighted by price direction."""
-    sign = df["Close"].diff().apply(lambda x: 1 if x > 0 else (-1 if x < 0 else 0))
-    df["obv"] = (sign * df["Volume"]).cumsum()
+    # Direction of each close vs the previous one; the first row (NaN diff) counts as flat
+    sign = np.sign(np.nan_to_num(df["Close"].diff().to_numpy()))
+    # Kept as float64 like every other indicator column, so strategies read it without a cast
+    # A NaN Volume row stays NaN without breaking the running total for later rows
+    df["obv"] = pd.Series(sign * df["Volume"].to_numpy(dtype=np.float64), index=df.index).cumsum()
+    # Signal line used by the OBV Trend strategy; computed once here for detection and backtests
+    df["obv_ema"] = df["obv"].ewm(span=OBV_EMA_PERIOD, adjust=False).mean()
     return df
@@ -1,7 +1,9 @@
 """Main orchestration script for stock technical analysis (Canadian + US AI)."""
 
 import argparse
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 
 from config import TICKERS, ALL_STOCKS, COMMODITY_TICKERS, COMMODITIES, FRED_SERIES, \
@@ -21,6 +23,22 @@ from backtesting.backtest_engine import BacktestEngine
 import pandas as pd
 
 
+def analyze_ticker(ticker: str, prices_df: pd.DataFrame, engine: BacktestEngine):
+    """Indicators, signals and per-strategy backtest results (or the error raised) for one ticker."""
+    ind_df = calculate_all_indicators(prices_df)
+    signals = detect_all_signals(ind_df, ticker)
+
+    results = []
+    for strategy_name, (entry_func, exit_func) in BACKTEST_STRATEGIES.items():
+        try:
+            entry_signals = entry_func(ind_df)
+            exit_signals = exit_func(ind_df)
+            results.append((strategy_name, engine.run(ind_df, entry_signals, exit_signals, ticker, strategy_name)))
+        except Exception as e:
+            results.append((strategy_name, e))
+    return ind_df, signals, results
+
+
 def run_pipeline(tickers: list[str], fetch: bool = True, force: bool = False):
     """Run the full analysis pipeline for given tickers."""
     init_db()
@@ -128,7 +146,6 @@ def run_pipeline(tickers: list[str], fetch: bool = True, force: bool = False):
 
         # Fetch macro data (FRED + BoC)
         print("\nFetching macro data...")
-        import os
         from dotenv import load_dotenv
         env_path = os.path.join(os.path.dirname(__file__), ".env.local")
         if os.path.exists(env_path):
@@ -187,47 +204,48 @@ def run_pipeline(tickers: list[str], fetch: bool = True, force: bool = False):
     print("CALCULATING INDICATORS & DETECTING SIGNALS")
     print("=" * 60)
 
-    for ticker in tickers:
-        prices_df = get_prices(ticker)
-        if prices_df.empty:
-            print(f"  {ticker}: No price data, skipping")
-            continue
-
-        # Reconstruct OHLCV DataFrame with date index
-        prices_df = prices_df.set_index("date")
-        prices_df.columns = [c.capitalize() if c != "volume" else "Volume"
-                             for c in prices_df.columns]
-        # Rename columns to match expected format
-        rename_map = {"Ticker": "Ticker", "Open": "Open", "High": "High",
-                      "Low": "Low", "Close": "Close", "Volume": "Volume"}
-        for old, new in rename_map.items():
-            if old.lower() in [c.lower() for c in prices_df.columns]:
-                pass  # columns already correct after capitalize
-
-        # Drop ticker column if present
-        if "Ticker" in prices_df.columns:
-            prices_df = prices_df.drop(columns=["Ticker"])
-
-        # Calculate indicators
-        ind_df = calculate_all_indicators(prices_df)
-        store_indicators(ticker, ind_df)
-
-        # Detect signals
-        signals = detect_all_signals(ind_df, ticker)
-        if signals:
-            store_signals(signals)
-        print(f"  {ticker}: {len(ind_df)} rows, {len(signals)} signals")
-
-        # Step 3: Backtest all strategies
-        for strategy_name, (entry_func, exit_func) in BACKTEST_STRATEGIES.items():
-            try:
-                entry_signals = entry_func(ind_df)
-                exit_signals = exit_func(ind_df)
-                result = engine.run(ind_df, entry_signals, exit_signals, ticker, strategy_name)
-                store_trades(ticker, strategy_name, result.trades)
-                store_performance(ticker, strategy_name, result)
-            except Exception as e:
-                print(f"    Backtest error ({strategy_name}): {e}")
+    # Indicators, signals and backtests are pure NumPy/pandas work per ticker, so they
+    # run on a thread pool (detection stays sequential inside each worker);
+    # reads and DB writes stay on this thread, in ticker order.
+    jobs = {}
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+        for ticker in tickers:
+            prices_df = get_prices(ticker)
+            if prices_df.empty:
+                jobs[ticker] = None
+                continue
+
+            # Reconstruct OHLCV DataFrame with date index
+            prices_df = prices_df.set_index("date")
+            prices_df.columns = [c.capitalize() if c != "volume" else "Volume"
+                                 for c in prices_df.columns]
+
+            # Drop ticker column if present
+            if "Ticker" in prices_df.columns:
+                prices_df = prices_df.drop(columns=["Ticker"])
+
+            jobs[ticker] = pool.submit(analyze_ticker, ticker, prices_df, engine)
+
+        for ticker, job in jobs.items():
+            if job is None:
+                print(f"  {ticker}: No price data, skipping")
+                continue
+
+            ind_df, signals, results = job.result()
+            store_indicators(ticker, ind_df)
+            if signals:
+                store_signals(signals)
+            print(f"  {ticker}: {len(ind_df)} rows, {len(signals)} signals")
+
+            for strategy_name, result in results:
+                if isinstance(result, Exception):
+                    print(f"    Backtest error ({strategy_name}): {result}")
+                    continue
+                try:
+                    store_trades(ticker, strategy_name, result.trades)
+                    store_performance(ticker, strategy_name, result)
+                except Exception as e:
+                    print(f"    Backtest error ({strategy_name}): {e}")
 
     print("\nPipeline complete.")
 
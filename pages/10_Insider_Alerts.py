@@ -44,6 +44,17 @@ def load_all_data():
     for df in (prices, indicators, trades):
         if not df.empty:
             df["date"] = pd.to_datetime(df["date"])
+    # SQLite hands back float64/int64; float32 is plenty for prices and bands
+    # and halves the bytes touched by every filter below.
+    for col in ("open", "high", "low", "close"):
+        prices[col] = pd.to_numeric(prices[col], downcast="float")
+    for col in ("rsi_14", "bb_upper", "bb_lower"):
+        indicators[col] = pd.to_numeric(indicators[col], downcast="float")
+    trades["shares"] = pd.to_numeric(trades["shares"], downcast="integer")
+    # Sort once here so the per-event lookups below can rely on (ticker, date)
+    # order instead of re-sorting every slice.
+    prices.sort_values(["ticker", "date"], inplace=True, ignore_index=True)
+    indicators.sort_values(["ticker", "date"], inplace=True, ignore_index=True)
     return prices, indicators, trades
 
 
@@ -51,164 +62,194 @@ def load_all_data():
 # Signal detection
 # ---------------------------------------------------------------------------
 
+def _aggregate_trades(trades):
+    """Collapse insider trades to one row per (ticker, date).
+
+    Most days have a single filing, so only the duplicated (ticker, date)
+    pairs go through the groupby; singles are mapped straight across.
+    """
+    cols = ["ticker", "date", "n_insiders", "insiders", "total_shares"]
+    dup = trades.duplicated(["ticker", "date"], keep=False)
+
+    singles = trades.loc[~dup]
+    singles = singles.assign(
+        n_insiders=singles["insider"].notna().astype(int),
+        insiders=singles["insider"].fillna(""),
+        total_shares=singles["shares"].fillna(0),
+    )[cols]
+
+    # Pre-sorting by insider lets dict.fromkeys dedupe in order, no per-group sort
+    multi = trades[dup].sort_values(["ticker", "date", "insider"])
+    multi = multi.groupby(["ticker", "date"], as_index=False).agg(
+        n_insiders=("insider", "nunique"),
+        insiders=("insider", lambda s: ", ".join(dict.fromkeys(s.dropna()))),
+        total_shares=("shares", "sum"),
+    )
+    if multi.empty:
+        return singles.reset_index(drop=True)
+    return pd.concat([singles, multi[cols]], ignore_index=True)
+
+
 def find_bb_insider_signals(prices, indicators, trades):
     """Find insider open-market buys where price was below the lower Bollinger Band.
 
-    Returns one row per unique (ticker, date) event.
+    Returns one row per unique (ticker, date) event. Each event is matched to
+    the latest indicator row and closing price within 5 days on or before the
+    trade date via as-of joins, rather than filtering the full tables per event.
     """
-    events = []
-    for (ticker, date), grp in trades.groupby(["ticker", "date"]):
-        # Nearest indicator on or before the trade date
-        ind_mask = (indicators["ticker"] == ticker) & (
-            indicators["date"] <= date
-        ) & (indicators["date"] >= date - timedelta(days=5))
-        ind_sub = indicators[ind_mask].sort_values("date", ascending=False)
-        if ind_sub.empty:
-            continue
-        ind_row = ind_sub.iloc[0]
-
-        bb_lower = ind_row["bb_lower"]
-        bb_upper = ind_row["bb_upper"]
-        rsi = ind_row["rsi_14"]
-        if pd.isna(bb_lower) or pd.isna(bb_upper):
-            continue
+    events = _aggregate_trades(trades)
+    if events.empty:
+        return pd.DataFrame()
 
-        # Nearest closing price on or before the trade date
-        pr_mask = (prices["ticker"] == ticker) & (
-            prices["date"] <= date
-        ) & (prices["date"] >= date - timedelta(days=5))
-        pr_sub = prices[pr_mask].sort_values("date", ascending=False)
-        if pr_sub.empty:
-            continue
-        close = pr_sub.iloc[0]["close"]
+    # 52-week high for context (needs at least 20 bars of history)
+    high_52w = (
+        prices.groupby("ticker")["high"]
+        .rolling(252, min_periods=20).max()
+        .reset_index(level=0, drop=True)
+    )
+    prices = prices[["ticker", "date", "close"]].assign(high_52w=high_52w)
 
-        if bb_upper == bb_lower:
-            continue
-        bb_pos = (close - bb_lower) / (bb_upper - bb_lower)
-        if bb_pos > 0.0:
-            continue  # not below lower band
+    window = pd.Timedelta(days=5)
+    events = pd.merge_asof(
+        events.sort_values("date"), indicators.sort_values("date"),
+        on="date", by="ticker", tolerance=window,
+    )
+    events = pd.merge_asof(
+        events, prices.sort_values("date"),
+        on="date", by="ticker", tolerance=window,
+    )
 
-        # 52-week high for context
-        hist = prices[(prices["ticker"] == ticker) & (prices["date"] <= date)]
-        high_52w = hist.tail(252)["high"].max() if len(hist) >= 20 else None
-        dd_52w = ((close - high_52w) / high_52w * 100) if high_52w else None
+    band = events["bb_upper"] - events["bb_lower"]
+    events["bb_pos"] = (events["close"] - events["bb_lower"]) / band
+    events = events[(band != 0) & (events["bb_pos"] <= 0.0)]  # below lower band
 
-        insiders = sorted(grp["insider"].unique())
-        events.append(
-            {
-                "ticker": ticker,
-                "signal_date": date,
-                "close": close,
-                "bb_lower": bb_lower,
-                "bb_pos": bb_pos,
-                "rsi": rsi,
-                "dd_52w": dd_52w,
-                "n_insiders": grp["insider"].nunique(),
-                "insiders": ", ".join(insiders),
-                "total_shares": grp["shares"].sum(),
-                "double_signal": (pd.notna(rsi) and rsi < 30),
-            }
-        )
-    return pd.DataFrame(events)
+    events = events.assign(
+        dd_52w=(events["close"] - events["high_52w"]) / events["high_52w"] * 100,
+        double_signal=events["rsi_14"] < 30,
+    )
+    events = events.rename(columns={"date": "signal_date", "rsi_14": "rsi"})
+    return events.sort_values(["ticker", "signal_date"], ignore_index=True)[
+        ["ticker", "signal_date", "close", "bb_lower", "bb_pos", "rsi", "dd_52w",
+         "n_insiders", "insiders", "total_shares", "double_signal"]
+    ]
 
 
 # ---------------------------------------------------------------------------
 # Portfolio simulation
 # ---------------------------------------------------------------------------
 
+def _ticker_bounds(prices):
+    """Map ticker -> (start, end) row positions of its block in prices.
+
+    Expects prices sorted by (ticker, date), as returned by load_all_data.
+    """
+    tickers = prices["ticker"].to_numpy()
+    starts = np.flatnonzero(np.r_[True, tickers[1:] != tickers[:-1]])
+    ends = np.r_[starts[1:], len(tickers)]
+    return {tickers[s]: (s, e) for s, e in zip(starts, ends)}
+
+
 def build_portfolio(events_df, prices):
     """Simulate the paper portfolio: buy next-day open, sell ~30 days later."""
     if events_df.empty:
         return pd.DataFrame()
 
-    portfolio = []
-    today = pd.Timestamp(datetime.now().date())
+    events = events_df.sort_values("signal_date", ignore_index=True)
+    n = len(events)
+    bounds = _ticker_bounds(prices)
+    dates = prices["date"].to_numpy()
+    hold_period = np.timedelta64(HOLD_DAYS, "D")
+
+    # Row positions into prices for each event's entry and exit (-1 = no entry)
+    buy_rows = np.full(n, -1, dtype=np.int64)
+    sell_rows = np.empty(n, dtype=np.int64)
+    is_open = np.zeros(n, dtype=bool)
 
-    for _, ev in events_df.sort_values("signal_date").iterrows():
-        ticker = ev["ticker"]
-        signal_date = ev["signal_date"]
+    signal_dates = events["signal_date"].to_numpy()
+    for i, ticker in enumerate(events["ticker"].to_numpy()):
+        if ticker not in bounds:
+            continue
+        start, end = bounds[ticker]
+        dates_t = dates[start:end]
 
         # Buy on next trading day (open price)
-        buy_mask = (prices["ticker"] == ticker) & (prices["date"] > signal_date)
-        buy_sub = prices[buy_mask].sort_values("date")
-        if buy_sub.empty:
+        i_buy = np.searchsorted(dates_t, signal_dates[i], side="right")
+        if i_buy >= len(dates_t):
             continue
-        buy_row = buy_sub.iloc[0]
-        buy_price = buy_row["open"]
-        buy_date = buy_row["date"]
-        shares = max(1, int(POSITION_SIZE / buy_price))
-        cost = shares * buy_price
-
-        # Sell ~30 days later (close price)
-        target_sell = buy_date + timedelta(days=HOLD_DAYS)
-        sell_mask = (prices["ticker"] == ticker) & (prices["date"] >= target_sell)
-        sell_sub = prices[sell_mask].sort_values("date")
-
-        if not sell_sub.empty:
-            sell_row = sell_sub.iloc[0]
-            sell_price = sell_row["close"]
-            sell_date = sell_row["date"]
-            status = "CLOSED"
-        else:
-            # Still open — use latest available price
-            latest = prices[prices["ticker"] == ticker].sort_values("date").iloc[-1]
-            sell_price = latest["close"]
-            sell_date = latest["date"]
-            status = "OPEN"
-
-        pnl = shares * (sell_price - buy_price)
-        ret_pct = ((sell_price - buy_price) / buy_price) * 100
-        hold = (sell_date - buy_date).days
-
-        portfolio.append(
-            {
-                "Ticker": ticker,
-                "Sector": SECTORS.get(ticker, ""),
-                "Signal": ev["signal_date"].strftime("%Y-%m-%d"),
-                "Insiders": ev["n_insiders"],
-                "RSI": round(ev["rsi"], 1) if pd.notna(ev["rsi"]) else None,
-                "BB Pos": round(ev["bb_pos"], 2),
-                "Double": ev["double_signal"],
-                "Entry Date": buy_date.strftime("%Y-%m-%d"),
-                "Entry $": round(buy_price, 2),
-                "Shares": shares,
-                "Cost": round(cost, 2),
-                "Exit Date": sell_date.strftime("%Y-%m-%d"),
-                "Exit $": round(sell_price, 2),
-                "P&L": round(pnl, 2),
-                "Return %": round(ret_pct, 1),
-                "Days": hold,
-                "Status": status,
-                # Keep raw dates for sorting / equity curve
-                "_buy_date": buy_date,
-                "_sell_date": sell_date,
-            }
-        )
-    return pd.DataFrame(portfolio)
+        # Sell ~30 days later (close price); still open -> use latest available price
+        i_sell = np.searchsorted(dates_t, dates_t[i_buy] + hold_period, side="left")
+        if i_sell >= len(dates_t):
+            i_sell = len(dates_t) - 1
+            is_open[i] = True
+        buy_rows[i] = start + i_buy
+        sell_rows[i] = start + i_sell
+
+    keep = buy_rows >= 0
+    events = events[keep]
+    buy_rows, sell_rows, is_open = buy_rows[keep], sell_rows[keep], is_open[keep]
+
+    buy_price = prices["open"].to_numpy()[buy_rows]
+    sell_price = prices["close"].to_numpy()[sell_rows]
+    buy_date = pd.DatetimeIndex(dates[buy_rows])
+    sell_date = pd.DatetimeIndex(dates[sell_rows])
+    shares = np.maximum(1, (POSITION_SIZE / buy_price).astype(np.int64))
+    pnl = shares * (sell_price - buy_price)
+    ret_pct = (sell_price - buy_price) / buy_price * 100
+
+    return pd.DataFrame(
+        {
+            "Ticker": events["ticker"].to_numpy(),
+            "Sector": events["ticker"].map(SECTORS).fillna("").to_numpy(),
+            "Signal": events["signal_date"].dt.strftime("%Y-%m-%d").to_numpy(),
+            "Insiders": events["n_insiders"].to_numpy(),
+            "RSI": np.round(events["rsi"].to_numpy(dtype=float), 1),
+            "BB Pos": np.round(events["bb_pos"].to_numpy(dtype=float), 2),
+            "Double": events["double_signal"].to_numpy(dtype=bool),
+            "Entry Date": buy_date.strftime("%Y-%m-%d"),
+            "Entry $": np.round(buy_price, 2),
+            "Shares": shares,
+            "Cost": np.round(shares * buy_price, 2),
+            "Exit Date": sell_date.strftime("%Y-%m-%d"),
+            "Exit $": np.round(sell_price, 2),
+            "P&L": np.round(pnl, 2),
+            "Return %": np.round(ret_pct, 1),
+            "Days": (sell_date - buy_date).days,
+            "Status": np.where(is_open, "OPEN", "CLOSED"),
+            # Keep raw dates for sorting / equity curve
+            "_buy_date": buy_date,
+            "_sell_date": sell_date,
+        }
+    )
 
 
 # ---------------------------------------------------------------------------
 # Styling helpers
 # ---------------------------------------------------------------------------
 
-def color_pnl(val):
-    if pd.isna(val):
-        return ""
-    if isinstance(val, str):
-        return ""
-    return "color: #16a34a; font-weight:600" if val > 0 else "color: #dc2626; font-weight:600" if val < 0 else ""
-
+# Helpers build CSS strings for whole columns at once (for Styler.apply)
+# rather than being called per cell.
 
-def color_status(val):
-    if val == "OPEN":
-        return "background-color: #fef3c7; font-weight:600"
-    return ""
+def color_pnl(col):
+    vals = pd.to_numeric(col, errors="coerce").to_numpy(dtype=float)
+    return np.where(
+        vals > 0, "color: #16a34a; font-weight:600",
+        np.where(vals < 0, "color: #dc2626; font-weight:600", ""),
+    )
 
 
-def color_double(val):
-    if val is True:
-        return "background-color: #dcfce7; font-weight:600"
-    return ""
+def style_portfolio(df, highlight_double=True):
+    """Build the CSS matrix for a portfolio table in one pass (Styler.apply, axis=None)."""
+    css = pd.DataFrame("", index=df.index, columns=df.columns)
+    css["P&L"] = color_pnl(df["P&L"])
+    css["Return %"] = color_pnl(df["Return %"])
+    css["Status"] = np.where(
+        df["Status"].to_numpy() == "OPEN", "background-color: #fef3c7; font-weight:600", ""
+    )
+    if highlight_double:
+        css["Double"] = np.where(
+            df["Double"].to_numpy(dtype=bool), "background-color: #dcfce7; font-weight:600", ""
+        )
+    return css
 
 
 # ---------------------------------------------------------------------------
@@ -334,9 +375,7 @@ display_df = pf[display_cols].copy()
 
 styled = (
     display_df.style
-    .map(color_pnl, subset=["P&L", "Return %"])
-    .map(color_status, subset=["Status"])
-    .map(color_double, subset=["Double"])
+    .apply(style_portfolio, axis=None)
     .format(
         {
             "Entry $": "${:.2f}",
@@ -390,7 +429,7 @@ with col_left:
     ticker_stats = ticker_stats.sort_values("Total_PnL", ascending=False)
     ticker_styled = (
         ticker_stats.style
-        .map(color_pnl, subset=["Total_PnL", "Avg_Return"])
+        .apply(color_pnl, subset=["Total_PnL", "Avg_Return"])
         .format({"Total_PnL": "${:+,.0f}", "Avg_Return": "{:+.1f}%", "Win %": "{:.0f}%"})
     )
     st.dataframe(ticker_styled, use_container_width=True, hide_index=True)
@@ -411,7 +450,7 @@ with col_right:
     sector_stats = sector_stats.sort_values("Total_PnL", ascending=False)
     sector_styled = (
         sector_stats.style
-        .map(color_pnl, subset=["Total_PnL", "Avg_Return"])
+        .apply(color_pnl, subset=["Total_PnL", "Avg_Return"])
         .format({"Total_PnL": "${:+,.0f}", "Avg_Return": "{:+.1f}%", "Win %": "{:.0f}%"})
     )
     st.dataframe(sector_styled, use_container_width=True, hide_index=True)
@@ -427,8 +466,7 @@ if not doubles.empty:
     double_display = doubles[display_cols].copy()
     double_styled = (
         double_display.style
-        .map(color_pnl, subset=["P&L", "Return %"])
-        .map(color_status, subset=["Status"])
+        .apply(style_portfolio, axis=None, highlight_double=False)
         .format(
             {
                 "Entry $": "${:.2f}",
@@ -9,7 +9,7 @@ from dashboard.components.charts import (
 )
 from dashboard.components.tables import style_return, style_direction
 from dashboard.components.styles import apply_custom_css
-from config import AI_ALL_STOCKS, AI_SECTORS, AI_TICKERS
+from config import AI_ALL_STOCKS, AI_SECTORS, AI_TICKERS, AI_TICKER_LABELS
 
 st.set_page_config(page_title="AI Stock Detail", page_icon="🤖", layout="wide")
 apply_custom_css()
@@ -18,11 +18,10 @@ st.caption("Prices in USD — no currency conversion applied.")
 
 init_db()
 
-ticker_labels = {t: f"{t} — {AI_ALL_STOCKS[t]}" for t in AI_TICKERS}
 selected = st.selectbox(
     "Select AI Stock",
     AI_TICKERS,
-    format_func=lambda t: ticker_labels[t],
+    format_func=lambda t: AI_TICKER_LABELS[t],
 )
 
 
@@ -8,7 +8,7 @@ from dashboard.components.charts import (
     create_candlestick_chart, create_rsi_chart, create_macd_chart,
 )
 from dashboard.components.styles import apply_custom_css
-from config import ALL_STOCKS
+from config import ALL_STOCKS, TICKER_LABELS
 
 st.set_page_config(page_title="Stock Detail", page_icon="📈", layout="wide")
 apply_custom_css()
@@ -17,9 +17,7 @@ st.title("Stock Detail")
 init_db()
 
 ticker_options = list(ALL_STOCKS.keys())
-ticker_labels = {t: f"{t} — {ALL_STOCKS[t]}" for t in ticker_options}
-
-selected = st.selectbox("Select Stock", ticker_options, format_func=lambda t: ticker_labels[t])
+selected = st.selectbox("Select Stock", ticker_options, format_func=lambda t: TICKER_LABELS[t])
 
 
 @st.cache_data(ttl=300)
@@ -47,8 +45,10 @@ cutoff_map = {"3M": 63, "6M": 126, "1Y": 252, "All": len(prices)}
 n_days = cutoff_map[time_range]
 
 prices_view = prices.tail(n_days)
-ind_view = indicators[indicators["date"].isin(prices_view["date"])] if not indicators.empty else indicators
-sig_view = signals[signals["date"].isin(prices_view["date"])] if not signals.empty else signals
+# prices are date-ordered, so the visible window is a contiguous date range
+first_date, last_date = prices_view["date"].iloc[0], prices_view["date"].iloc[-1]
+ind_view = indicators[indicators["date"].between(first_date, last_date)] if not indicators.empty else indicators
+sig_view = signals[signals["date"].between(first_date, last_date)] if not signals.empty else signals
 
 # Candlestick chart with overlays
 col_ema, col_sma, col_vwap, col_bb = st.columns(4)
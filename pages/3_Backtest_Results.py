@@ -5,9 +5,9 @@ import pandas as pd
 
 from data.database import get_performance, get_trades, init_db
 from dashboard.components.charts import create_equity_curve
-from dashboard.components.tables import style_return, format_pct
+from dashboard.components.tables import style_return_column, format_pct, paginate
 from dashboard.components.styles import apply_custom_css
-from config import ALL_STOCKS, TICKERS
+from config import TICKER_LABELS, TICKERS
 
 st.set_page_config(page_title="Backtest Results", page_icon="📈", layout="wide")
 apply_custom_css()
@@ -18,11 +18,15 @@ init_db()
 
 @st.cache_data(ttl=300)
 def load_backtest_data():
+    """Load performance rows with their sorted ticker and strategy options."""
     perf = get_performance()
-    return perf
+    if perf.empty:
+        return perf, [], []
+    perf = perf.astype({"ticker": "category", "strategy": "category"})
+    return perf, sorted(perf["ticker"].unique()), sorted(perf["strategy"].unique())
 
 
-perf = load_backtest_data()
+perf, tickers, strategies = load_backtest_data()
 
 if perf.empty:
     st.warning("No backtest results. Run `python main.py` first.")
@@ -31,28 +35,30 @@ if perf.empty:
 # Filters
 col1, col2 = st.columns(2)
 with col1:
-    strategies = sorted(perf["strategy"].unique())
     selected_strategies = st.multiselect("Strategies", strategies, default=strategies)
 with col2:
-    tickers = sorted(perf["ticker"].unique())
     selected_tickers = st.multiselect("Tickers", tickers, default=tickers,
-                                       format_func=lambda t: f"{t} — {ALL_STOCKS.get(t, '')}")
+                                       format_func=lambda t: TICKER_LABELS.get(t, t))
 
 filtered = perf[perf["strategy"].isin(selected_strategies) & perf["ticker"].isin(selected_tickers)]
 
 # Strategy rankings by Sharpe ratio
 st.subheader("Strategy Rankings (by average Sharpe ratio)")
 
-strategy_summary = filtered.groupby("strategy").agg({
-    "sharpe_ratio": "mean",
-    "total_return": "mean",
-    "win_rate": "mean",
-    "max_drawdown": "mean",
-    "total_trades": "sum",
-}).round(2).sort_values("sharpe_ratio", ascending=False)
-
-strategy_summary.columns = ["Avg Sharpe", "Avg Return %", "Avg Win Rate %", "Avg Max DD %", "Total Trades"]
-st.dataframe(strategy_summary, use_container_width=True)
+strategy_summary = filtered.groupby("strategy", observed=True).agg(**{
+    "Avg Sharpe": ("sharpe_ratio", "mean"),
+    "Avg Return %": ("total_return", "mean"),
+    "Avg Win Rate %": ("win_rate", "mean"),
+    "Avg Max DD %": ("max_drawdown", "mean"),
+    "Total Trades": ("total_trades", "sum"),
+}).sort_values("Avg Sharpe", ascending=False)
+
+st.dataframe(strategy_summary.style.format({
+    "Avg Sharpe": "{:.2f}",
+    "Avg Return %": "{:.2f}",
+    "Avg Win Rate %": "{:.2f}",
+    "Avg Max DD %": "{:.2f}",
+}, na_rep="—"), use_container_width=True)
 
 # Detailed performance table
 st.subheader("Detailed Performance")
@@ -60,13 +66,14 @@ st.subheader("Detailed Performance")
 display_cols = ["ticker", "strategy", "total_trades", "win_rate", "avg_gain",
                 "avg_loss", "risk_reward", "max_drawdown", "total_return",
                 "buy_hold_return", "sharpe_ratio"]
-detail = filtered[display_cols].copy()
-detail.columns = ["Ticker", "Strategy", "Trades", "Win Rate %", "Avg Gain %",
-                   "Avg Loss %", "Risk/Reward", "Max DD %", "Strategy Return %",
-                   "Buy & Hold %", "Sharpe"]
-
-styled = detail.style.map(
-    style_return, subset=["Strategy Return %", "Buy & Hold %", "Max DD %"]
+detail = filtered[display_cols].set_axis(
+    ["Ticker", "Strategy", "Trades", "Win Rate %", "Avg Gain %",
+     "Avg Loss %", "Risk/Reward", "Max DD %", "Strategy Return %",
+     "Buy & Hold %", "Sharpe"], axis=1)
+
+view = paginate(detail, key="backtest_detail")
+styled = view.style.apply(
+    style_return_column, subset=["Strategy Return %", "Buy & Hold %", "Max DD %"]
 ).format({
     "Win Rate %": "{:.1f}%",
     "Avg Gain %": "{:+.2f}%",
@@ -84,8 +91,11 @@ st.dataframe(styled, use_container_width=True, hide_index=True, height=500)
 st.subheader("Win Rate by Strategy")
 import plotly.graph_objects as go
 
+static_charts = st.toggle("Static charts", help="Render charts without hover/zoom to lighten the page.")
+chart_config = {"staticPlot": static_charts}
+
 if not filtered.empty:
-    wr_by_strategy = filtered.groupby("strategy")["win_rate"].mean().sort_values(ascending=True)
+    wr_by_strategy = filtered.groupby("strategy", observed=True)["win_rate"].mean().sort_values(ascending=True)
 
     fig_wr = go.Figure(go.Bar(
         x=wr_by_strategy.values,
@@ -101,16 +111,16 @@ if not filtered.empty:
         xaxis_title="Win Rate %", margin=dict(l=120, r=20, t=40, b=30),
         paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
     )
-    st.plotly_chart(fig_wr, use_container_width=True)
+    st.plotly_chart(fig_wr, use_container_width=True, config=chart_config)
 
 # Equity curve for selected ticker/strategy
 st.subheader("Equity Curve")
 col_t, col_s = st.columns(2)
 with col_t:
-    eq_ticker = st.selectbox("Ticker", sorted(perf["ticker"].unique()), key="eq_ticker",
-                              format_func=lambda t: f"{t} — {ALL_STOCKS.get(t, '')}")
+    eq_ticker = st.selectbox("Ticker", tickers, key="eq_ticker",
+                              format_func=lambda t: TICKER_LABELS.get(t, t))
 with col_s:
-    eq_strategy = st.selectbox("Strategy", sorted(perf["strategy"].unique()), key="eq_strat")
+    eq_strategy = st.selectbox("Strategy", strategies, key="eq_strat")
 
 
 @st.cache_data(ttl=300)
@@ -118,9 +128,14 @@ def load_trades(ticker, strategy):
     return get_trades(ticker, strategy)
 
 
+@st.cache_resource(ttl=300)
+def load_equity_figure(ticker, strategy):
+    """Build the equity curve once per (ticker, strategy); reruns reuse the figure."""
+    return create_equity_curve(load_trades(ticker, strategy), height=350)
+
+
 trades = load_trades(eq_ticker, eq_strategy)
-fig_eq = create_equity_curve(trades, height=350)
-st.plotly_chart(fig_eq, use_container_width=True)
+st.plotly_chart(load_equity_figure(eq_ticker, eq_strategy), use_container_width=True, config=chart_config)
 
 if not trades.empty:
     st.caption(f"{len(trades)} trades for {eq_ticker} using {eq_strategy}")
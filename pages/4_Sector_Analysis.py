@@ -7,7 +7,7 @@ from data.database import get_performance, get_prices, init_db
 from dashboard.components.charts import (
     create_sector_comparison, create_correlation_heatmap,
 )
-from dashboard.components.tables import style_return
+from dashboard.components.tables import style_return_column
 from dashboard.components.styles import apply_custom_css
 from config import SECTORS, ALL_STOCKS, SECTOR_GROUPS, SECTOR_NAMES
 
@@ -20,12 +20,20 @@ init_db()
 
 @st.cache_data(ttl=300)
 def load_sector_data():
+    """Load performance rows, their sorted strategies, and closes pivoted to date x ticker."""
     perf = get_performance()
-    prices = get_prices()
-    return perf, prices
+    strategies = []
+    if not perf.empty:
+        perf = perf.astype({"ticker": "category", "strategy": "category"})
+        strategies = sorted(perf["strategy"].unique())
+    prices = get_prices(columns=["ticker", "date", "close"])
+    if prices.empty:
+        return perf, strategies, pd.DataFrame()
+    closes = prices.pivot(index="date", columns="ticker", values="close")
+    return perf, strategies, closes
 
 
-perf, all_prices = load_sector_data()
+perf, strategies, all_closes = load_sector_data()
 
 if perf.empty:
     st.warning("No performance data. Run `python main.py` first.")
@@ -34,47 +42,54 @@ if perf.empty:
 # Sector comparison charts
 st.subheader("Sector Performance Comparison")
 
+static_charts = st.toggle("Static charts", help="Render charts without hover/zoom to lighten the page.")
+chart_config = {"staticPlot": static_charts}
+
 metric = st.selectbox("Metric", [
     "total_return", "win_rate", "sharpe_ratio", "max_drawdown",
 ], format_func=lambda m: m.replace("_", " ").title())
 
-strategy_filter = st.selectbox("Strategy", ["All"] + sorted(perf["strategy"].unique()))
+strategy_filter = st.selectbox("Strategy", ["All"] + strategies)
 if strategy_filter != "All":
     perf_filtered = perf[perf["strategy"] == strategy_filter]
 else:
     perf_filtered = perf
 
 fig_sector = create_sector_comparison(perf_filtered, metric=metric)
-st.plotly_chart(fig_sector, use_container_width=True)
+st.plotly_chart(fig_sector, use_container_width=True, config=chart_config)
 
 # Sector breakdown tables
 st.subheader("Sector Breakdown")
 
 tabs = st.tabs(SECTOR_NAMES)
 
-for tab, (sector_name, sector_dict) in zip(tabs, SECTOR_GROUPS):
+# Average by ticker across strategies, for every sector in one pass
+sector_ticker_avg = perf_filtered.assign(sector=perf_filtered["ticker"].map(SECTORS)).groupby(
+    ["sector", "ticker"], observed=True
+).agg({
+    "total_return": "mean",
+    "win_rate": "mean",
+    "sharpe_ratio": "mean",
+    "max_drawdown": "mean",
+    "buy_hold_return": "first",
+})
+present_sectors = set(sector_ticker_avg.index.get_level_values("sector"))
+
+for tab, sector_name in zip(tabs, SECTOR_NAMES):
     with tab:
-        sector_perf = perf_filtered[perf_filtered["ticker"].isin(sector_dict.keys())]
-        if sector_perf.empty:
+        if sector_name not in present_sectors:
             st.info(f"No data for {sector_name}")
             continue
 
-        # Average by ticker across strategies
-        ticker_avg = sector_perf.groupby("ticker").agg({
-            "total_return": "mean",
-            "win_rate": "mean",
-            "sharpe_ratio": "mean",
-            "max_drawdown": "mean",
-            "buy_hold_return": "first",
-        }).round(2)
+        ticker_avg = sector_ticker_avg.xs(sector_name, level="sector")
 
         ticker_avg["name"] = ticker_avg.index.map(ALL_STOCKS)
         ticker_avg = ticker_avg[["name", "total_return", "buy_hold_return", "win_rate", "sharpe_ratio", "max_drawdown"]]
         ticker_avg.columns = ["Name", "Avg Strategy Return %", "Buy & Hold %", "Avg Win Rate %", "Avg Sharpe", "Avg Max DD %"]
         ticker_avg = ticker_avg.sort_values("Avg Sharpe", ascending=False)
 
-        styled = ticker_avg.style.map(
-            style_return, subset=["Avg Strategy Return %", "Buy & Hold %", "Avg Max DD %"]
+        styled = ticker_avg.style.apply(
+            style_return_column, subset=["Avg Strategy Return %", "Buy & Hold %", "Avg Max DD %"]
         ).format({
             "Avg Strategy Return %": "{:+.2f}%",
             "Buy & Hold %": "{:+.2f}%",
@@ -93,16 +108,13 @@ sector_map = {name: d for name, d in SECTOR_GROUPS}
 sector_map["All"] = ALL_STOCKS
 corr_tickers = list(sector_map[sector_corr].keys())
 
-if not all_prices.empty:
-    prices_dict = {}
-    for ticker in corr_tickers:
-        tk_prices = all_prices[all_prices["ticker"] == ticker].set_index("date")["close"]
-        if not tk_prices.empty:
-            prices_dict[ticker] = tk_prices
+if not all_closes.empty:
+    # Keep only dates where at least one selected ticker traded
+    corr_closes = all_closes.reindex(columns=corr_tickers).dropna(axis=1, how="all").dropna(how="all")
 
-    if prices_dict:
-        fig_corr = create_correlation_heatmap(prices_dict, height=max(400, len(prices_dict) * 25))
-        st.plotly_chart(fig_corr, use_container_width=True)
+    if not corr_closes.empty:
+        fig_corr = create_correlation_heatmap(corr_closes, height=max(400, corr_closes.shape[1] * 25))
+        st.plotly_chart(fig_corr, use_container_width=True, config=chart_config)
     else:
         st.info("No price data available for correlation analysis.")
 else:
@@ -112,11 +124,12 @@ else:
 st.subheader("Best Strategy by Sector")
 
 if not perf.empty:
-    best = perf.copy()
-    best["sector"] = best["ticker"].map(SECTORS)
-    best_by_sector = best.groupby(["sector", "strategy"])["sharpe_ratio"].mean().reset_index()
-    best_by_sector = best_by_sector.sort_values(["sector", "sharpe_ratio"], ascending=[True, False])
-    top_per_sector = best_by_sector.groupby("sector").head(3)
+    best = perf.assign(sector=perf["ticker"].map(SECTORS).astype("category"))
+    top_per_sector = (
+        best.groupby(["sector", "strategy"], observed=True)["sharpe_ratio"].mean()
+        .groupby(level="sector", observed=True, group_keys=False).nlargest(3)
+        .reset_index()
+    )
     top_per_sector.columns = ["Sector", "Strategy", "Avg Sharpe Ratio"]
     top_per_sector["Avg Sharpe Ratio"] = top_per_sector["Avg Sharpe Ratio"].round(2)
     st.dataframe(top_per_sector, use_container_width=True, hide_index=True)
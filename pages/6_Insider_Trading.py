@@ -2,11 +2,13 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 
 from data.database import get_insider_trades, init_db
 from data.data_fetcher import fetch_usdcad_rate
 from dashboard.components.styles import apply_custom_css
-from config import ALL_STOCKS, SECTORS
+from dashboard.components.tables import paginate
+from config import ALL_STOCKS, SECTORS, SECTOR_NAMES, SECTOR_TO_TICKERS
 
 st.set_page_config(page_title="Insider Trading", page_icon="👔", layout="wide")
 apply_custom_css()
@@ -17,7 +19,30 @@ init_db()
 
 @st.cache_data(ttl=300)
 def load_insider_data():
-    return get_insider_trades()
+    """Load insider trades with USD price-per-share and buy/sell direction precomputed.
+
+    Yahoo reports all .TO insider data in USD; the CAD conversion is applied
+    outside the cache so the FX rate can refresh on its own TTL.
+    """
+    df = get_insider_trades()
+    if df.empty:
+        return df
+
+    shares = df["shares"].to_numpy(dtype=float)
+    value = df["value"].to_numpy(dtype=float)
+    has_shares = ~np.isnan(shares) & (shares != 0)
+    df["pps_usd"] = np.divide(value, shares, out=np.full_like(value, np.nan), where=has_shares)
+
+    # Classify transactions as buy or sell (buy keywords take precedence)
+    txn = df["transaction_type"].astype("string").str.lower()
+    is_buy = txn.str.contains("purchase|buy|acquisition", regex=True, na=False).to_numpy(dtype=bool)
+    is_sell = txn.str.contains("sale|sell|disposition", regex=True, na=False).to_numpy(dtype=bool)
+    df["direction"] = pd.Categorical(
+        np.where(is_buy, "Buy", np.where(is_sell, "Sell", "Other")), categories=["Buy", "Sell", "Other"]
+    )
+    df = df.astype({"ticker": "category", "transaction_type": "category"})
+    # Sort once here (newest first within each ticker) so filtered views keep a stable order
+    return df.sort_values(["ticker", "date"], ascending=[True, False], kind="stable", ignore_index=True)
 
 
 @st.cache_data(ttl=3600)
@@ -35,43 +60,30 @@ if trades_df.empty:
 usdcad = load_fx_rate()
 
 
-def compute_cad_price_per_share(row):
-    """Compute price-per-share in CAD. Yahoo reports all .TO insider data in USD."""
-    shares = row["shares"]
-    value = row["value"]
-    if pd.isna(shares) or pd.isna(value) or shares == 0:
-        return None
-
-    pps_usd = value / shares
-    return round(pps_usd * usdcad, 2)
-
-
 # Add CAD price-per-share and converted value columns
-trades_df = trades_df.copy()
-trades_df["cad_pps"] = trades_df.apply(compute_cad_price_per_share, axis=1)
-
-
-def compute_cad_value(row):
-    """Recompute value in CAD using the CAD price-per-share."""
-    if pd.isna(row["cad_pps"]) or pd.isna(row["shares"]) or row["shares"] == 0:
-        return row["value"]
-    return round(row["cad_pps"] * abs(row["shares"]), 2)
-
-
-trades_df["value_cad"] = trades_df.apply(compute_cad_value, axis=1)
+cad_pps = np.round(trades_df["pps_usd"].to_numpy() * usdcad, 2)
+trades_df = trades_df.assign(
+    cad_pps=cad_pps,
+    # Recompute value in CAD using the CAD price-per-share
+    value_cad=np.where(
+        np.isnan(cad_pps),
+        trades_df["value"].to_numpy(dtype=float),
+        np.round(cad_pps * np.abs(trades_df["shares"].to_numpy(dtype=float)), 2),
+    ),
+)
 
 # --- Filters ---
 col_filter1, col_filter2, col_filter3 = st.columns(3)
 
 with col_filter1:
-    sector_options = ["All"] + sorted(set(SECTORS.values()))
+    sector_options = ["All"] + sorted(SECTOR_NAMES)
     sector_filter = st.selectbox("Sector", sector_options)
+sector_tickers = SECTOR_TO_TICKERS.get(sector_filter, [])
 
 with col_filter2:
     if sector_filter == "All":
         available_tickers = sorted(trades_df["ticker"].unique())
     else:
-        sector_tickers = [t for t, s in SECTORS.items() if s == sector_filter]
         available_tickers = sorted([t for t in trades_df["ticker"].unique() if t in sector_tickers])
     ticker_options = ["All stocks"] + available_tickers
     ticker_filter = st.selectbox("Ticker", ticker_options)
@@ -80,30 +92,14 @@ with col_filter3:
     txn_type_filter = st.selectbox("Transaction type", ["All", "Buys only", "Sells only"])
 
 # Apply filters
-filtered = trades_df.copy()
+filtered = trades_df
 
 if sector_filter != "All":
-    sector_tickers = [t for t, s in SECTORS.items() if s == sector_filter]
     filtered = filtered[filtered["ticker"].isin(sector_tickers)]
 
 if ticker_filter != "All stocks":
     filtered = filtered[filtered["ticker"] == ticker_filter]
 
-
-# Classify transactions as buy or sell
-def classify_txn(txn_type):
-    if pd.isna(txn_type):
-        return "Other"
-    t = str(txn_type).lower()
-    if any(kw in t for kw in ["purchase", "buy", "acquisition"]):
-        return "Buy"
-    elif any(kw in t for kw in ["sale", "sell", "disposition"]):
-        return "Sell"
-    return "Other"
-
-
-filtered["direction"] = filtered["transaction_type"].apply(classify_txn)
-
 if txn_type_filter == "Buys only":
     filtered = filtered[filtered["direction"] == "Buy"]
 elif txn_type_filter == "Sells only":
@@ -127,33 +123,31 @@ col5.metric("USD/CAD Rate", f"{usdcad:.4f}")
 # --- Summary by stock ---
 st.subheader("Activity by Stock")
 
-summary_rows = []
-for ticker in sorted(filtered["ticker"].unique()):
-    tk_data = filtered[filtered["ticker"] == ticker]
-    buys = tk_data[tk_data["direction"] == "Buy"]
-    sells = tk_data[tk_data["direction"] == "Sell"]
-    summary_rows.append({
-        "Ticker": ticker,
-        "Name": ALL_STOCKS.get(ticker, ""),
-        "Sector": SECTORS.get(ticker, ""),
-        "Buy Txns": len(buys),
-        "Sell Txns": len(sells),
-        "Buy Value (CAD)": buys["value_cad"].sum() if not buys.empty else 0,
-        "Sell Value (CAD)": sells["value_cad"].sum() if not sells.empty else 0,
-        "Net Sentiment": "Bullish" if len(buys) > len(sells) else ("Bearish" if len(sells) > len(buys) else "Neutral"),
+if not filtered.empty:
+    counts = (
+        filtered.groupby(["ticker", "direction"], observed=True)
+        .agg(n=("ticker", "size"), v=("value_cad", "sum"))
+        .unstack("direction", fill_value=0)
+        .reindex(columns=pd.MultiIndex.from_product([["n", "v"], ["Buy", "Sell"]]), fill_value=0)
+    )
+    buy_n = counts["n", "Buy"].to_numpy()
+    sell_n = counts["n", "Sell"].to_numpy()
+    summary_df = pd.DataFrame({
+        "Ticker": counts.index,
+        "Name": pd.Series(ALL_STOCKS).reindex(counts.index).fillna("").to_numpy(),
+        "Sector": pd.Series(SECTORS).reindex(counts.index).fillna("").to_numpy(),
+        "Buy Txns": buy_n,
+        "Sell Txns": sell_n,
+        "Buy Value (CAD)": counts["v", "Buy"].to_numpy(),
+        "Sell Value (CAD)": counts["v", "Sell"].to_numpy(),
+        "Net Sentiment": np.select([buy_n > sell_n, sell_n > buy_n], ["Bullish", "Bearish"], default="Neutral"),
     })
 
-if summary_rows:
-    summary_df = pd.DataFrame(summary_rows)
-
-    def style_sentiment(val):
-        if val == "Bullish":
-            return "color: #00c853"
-        elif val == "Bearish":
-            return "color: #ff1744"
-        return ""
+    def style_sentiment(col):
+        vals = col.to_numpy()
+        return np.where(vals == "Bullish", "color: #00c853", np.where(vals == "Bearish", "color: #ff1744", ""))
 
-    styled_summary = summary_df.style.map(style_sentiment, subset=["Net Sentiment"])
+    styled_summary = summary_df.style.apply(style_sentiment, subset=["Net Sentiment"])
     styled_summary = styled_summary.format({
         "Buy Value (CAD)": "${:,.0f}",
         "Sell Value (CAD)": "${:,.0f}",
@@ -164,20 +158,20 @@ if summary_rows:
 st.subheader("Transaction Details")
 
 if not filtered.empty:
-    display_df = filtered[["ticker", "date", "insider", "position", "transaction_type",
-                           "direction", "shares", "cad_pps", "value_cad", "ownership"]].copy()
-    display_df["date"] = display_df["date"].dt.strftime("%Y-%m-%d")
-    display_df.columns = ["Ticker", "Date", "Insider", "Position", "Transaction",
-                          "Direction", "Shares", "CAD/Share", "Value (CAD)", "Ownership"]
-
-    def style_direction(val):
-        if val == "Buy":
-            return "color: #00c853"
-        elif val == "Sell":
-            return "color: #ff1744"
-        return ""
-
-    styled_detail = display_df.style.map(style_direction, subset=["Direction"])
+    display_df = (
+        filtered[["ticker", "date", "insider", "position", "transaction_type",
+                  "direction", "shares", "cad_pps", "value_cad", "ownership"]]
+        .assign(date=filtered["date"].dt.strftime("%Y-%m-%d"))
+        .set_axis(["Ticker", "Date", "Insider", "Position", "Transaction",
+                   "Direction", "Shares", "CAD/Share", "Value (CAD)", "Ownership"], axis=1)
+    )
+
+    def style_direction(col):
+        vals = col.to_numpy()
+        return np.where(vals == "Buy", "color: #00c853", np.where(vals == "Sell", "color: #ff1744", ""))
+
+    view_df = paginate(display_df, key="insider_details")
+    styled_detail = view_df.style.apply(style_direction, subset=["Direction"])
     styled_detail = styled_detail.format({
         "Shares": "{:,.0f}",
         "CAD/Share": "${:,.2f}",
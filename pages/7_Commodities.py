@@ -1,12 +1,14 @@
 """Page 7: Commodities — Commodity price tracking and stock correlation."""
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
-from data.database import get_prices, init_db
+from data.database import get_prices_bulk, init_db
+from dashboard.components.charts import downsample_lttb
 from dashboard.components.styles import apply_custom_css
-from config import COMMODITIES, COMMODITY_TICKERS, COMMODITY_STOCK_MAP, ALL_STOCKS
+from config import COMMODITIES, COMMODITY_TICKERS, COMMODITY_STOCK_MAP, TICKER_LABELS
 
 st.set_page_config(page_title="Commodities", page_icon="🛢️", layout="wide")
 apply_custom_css()
@@ -18,12 +20,13 @@ init_db()
 @st.cache_data(ttl=300)
 def load_commodity_prices():
     """Load price data for all commodities."""
-    frames = {}
-    for ticker in COMMODITY_TICKERS:
-        df = get_prices(ticker)
-        if not df.empty:
-            frames[ticker] = df
-    return frames
+    return get_prices_bulk(COMMODITY_TICKERS)
+
+
+@st.cache_data(ttl=300)
+def load_related_prices(tickers):
+    """Load price data for the stocks linked to a commodity."""
+    return get_prices_bulk(list(tickers))
 
 
 commodity_data = load_commodity_prices()
@@ -35,46 +38,32 @@ if not commodity_data:
 # --- Summary table ---
 st.subheader("Summary")
 
-summary_rows = []
-for ticker in COMMODITY_TICKERS:
-    df = commodity_data.get(ticker)
-    if df is None or len(df) < 2:
-        continue
-    df_sorted = df.sort_values("date")
-    latest = df_sorted.iloc[-1]
-    prev = df_sorted.iloc[-2]
-    price = latest["close"]
-    daily_chg = (price - prev["close"]) / prev["close"] * 100
-
-    # 1-week change (5 trading days)
-    if len(df_sorted) >= 6:
-        week_ago = df_sorted.iloc[-6]["close"]
-        week_chg = (price - week_ago) / week_ago * 100
-    else:
-        week_chg = None
-
-    summary_rows.append({
-        "Commodity": COMMODITIES[ticker],
-        "Ticker": ticker,
+# Latest, previous and 1-week-ago (5 trading days) closes for every commodity at once;
+# frames are date-ordered from SQL, so positional nth picks them per ticker
+by_ticker = pd.concat(commodity_data.values(), ignore_index=True).groupby("ticker", sort=False)
+counts = by_ticker.size()
+summary_tickers = [t for t in COMMODITY_TICKERS if counts.get(t, 0) >= 2]
+
+if summary_tickers:
+    latest = by_ticker.nth(-1).set_index("ticker").reindex(summary_tickers)
+    prev_close = by_ticker.nth(-2).set_index("ticker")["close"].reindex(summary_tickers).to_numpy()
+    week_ago = by_ticker.nth(-6).set_index("ticker")["close"].reindex(summary_tickers).to_numpy()
+    price = latest["close"].to_numpy()
+
+    summary_df = pd.DataFrame({
+        "Commodity": [COMMODITIES[t] for t in summary_tickers],
+        "Ticker": summary_tickers,
         "Price": price,
-        "Daily Chg %": daily_chg,
-        "1W Chg %": week_chg,
-        "Date": latest["date"].strftime("%Y-%m-%d"),
+        "Daily Chg %": (price - prev_close) / prev_close * 100,
+        "1W Chg %": (price - week_ago) / week_ago * 100,
+        "Date": latest["date"].dt.strftime("%Y-%m-%d").to_numpy(),
     })
 
-if summary_rows:
-    summary_df = pd.DataFrame(summary_rows)
+    def style_change(col):
+        vals = col.to_numpy(dtype=float)
+        return np.where(vals > 0, "color: #00c853", np.where(vals < 0, "color: #ff1744", ""))
 
-    def style_change(val):
-        if pd.isna(val):
-            return ""
-        if val > 0:
-            return "color: #00c853"
-        elif val < 0:
-            return "color: #ff1744"
-        return ""
-
-    styled = summary_df.style.map(
+    styled = summary_df.style.apply(
         style_change, subset=["Daily Chg %", "1W Chg %"]
     ).format({
         "Price": "${:,.2f}",
@@ -99,11 +88,13 @@ time_range = st.radio(
 cutoff_map = {"1M": 21, "3M": 63, "6M": 126, "1Y": 252, "All": 99999}
 n_days = cutoff_map[time_range]
 
-df = commodity_data[selected].sort_values("date").tail(n_days)
+# Frames come back from SQLite already ordered by date
+df = commodity_data[selected].iloc[-n_days:]
 
 fig = go.Figure()
-fig.add_trace(go.Scatter(
-    x=df["date"], y=df["close"],
+dates, closes = downsample_lttb(df["date"], df["close"])
+fig.add_trace(go.Scattergl(
+    x=dates, y=closes,
     mode="lines",
     name=COMMODITIES[selected],
     line=dict(color="#00bcd4", width=2),
@@ -128,12 +119,12 @@ if related:
     fig2 = go.Figure()
 
     # Commodity series
-    comm_df = df.copy()
+    comm_df = df
     if not comm_df.empty:
-        base = comm_df.iloc[0]["close"]
-        comm_df["normalized"] = comm_df["close"] / base * 100
-        fig2.add_trace(go.Scatter(
-            x=comm_df["date"], y=comm_df["normalized"],
+        closes = comm_df["close"].to_numpy(dtype=float)
+        dates, normalized = downsample_lttb(comm_df["date"], closes / closes[0] * 100)
+        fig2.add_trace(go.Scattergl(
+            x=dates, y=normalized,
             mode="lines",
             name=COMMODITIES[selected],
             line=dict(width=3),
@@ -141,21 +132,22 @@ if related:
 
     # Related stock series
     colors = ["#ff9800", "#e91e63", "#4caf50", "#9c27b0", "#ffeb3b", "#00e5ff"]
+    related_prices = load_related_prices(tuple(related))
+    min_date = np.datetime64(comm_df["date"].min())
     for i, stock_ticker in enumerate(related):
-        stock_df = get_prices(stock_ticker)
-        if stock_df.empty:
+        stock_df = related_prices.get(stock_ticker)
+        if stock_df is None:
             continue
-        stock_df = stock_df.sort_values("date")
-        # Align to commodity date range
-        min_date = comm_df["date"].min()
-        stock_df = stock_df[stock_df["date"] >= min_date].tail(n_days)
+        # Align to commodity date range (dates are sorted, so binary-search the start)
+        start = stock_df["date"].to_numpy().searchsorted(min_date)
+        stock_df = stock_df.iloc[max(start, len(stock_df) - n_days):]
         if stock_df.empty:
             continue
-        base = stock_df.iloc[0]["close"]
-        stock_df["normalized"] = stock_df["close"] / base * 100
-        label = f"{stock_ticker} — {ALL_STOCKS.get(stock_ticker, '')}"
-        fig2.add_trace(go.Scatter(
-            x=stock_df["date"], y=stock_df["normalized"],
+        closes = stock_df["close"].to_numpy(dtype=float)
+        label = TICKER_LABELS.get(stock_ticker, stock_ticker)
+        dates, normalized = downsample_lttb(stock_df["date"], closes / closes[0] * 100)
+        fig2.add_trace(go.Scattergl(
+            x=dates, y=normalized,
             mode="lines",
             name=label,
             line=dict(color=colors[i % len(colors)], width=2),
@@ -1,11 +1,12 @@
 """Page 8: News & Earnings Calendar — Recent headlines and upcoming earnings dates."""
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 
 from data.database import get_news, get_earnings, init_db
 from dashboard.components.styles import apply_custom_css
-from config import ALL_STOCKS, SECTORS
+from config import ALL_STOCKS, SECTORS, SECTOR_NAMES, SECTOR_TO_TICKERS
 
 st.set_page_config(page_title="News & Calendar", page_icon="📰", layout="wide")
 apply_custom_css()
@@ -36,29 +37,27 @@ if not earnings_df.empty:
     earnings_display = earnings_display.rename(columns={
         "ticker": "Ticker", "earnings_date": "Earnings Date",
     })
+    # Parse once (stored as ISO YYYY-MM-DD); the filter and highlight compare datetimes directly
+    earnings_display["Earnings Date"] = pd.to_datetime(
+        earnings_display["Earnings Date"], format="%Y-%m-%d", errors="coerce"
+    )
     earnings_display = earnings_display[["Ticker", "Name", "Sector", "Earnings Date"]]
     earnings_display = earnings_display.sort_values("Earnings Date")
 
     # Drop earnings more than 5 days before today
     today = pd.Timestamp.now().normalize()
     cutoff = today - pd.Timedelta(days=5)
-    earnings_display = earnings_display[
-        pd.to_datetime(earnings_display["Earnings Date"]) >= cutoff
-    ]
+    earnings_display = earnings_display[earnings_display["Earnings Date"] >= cutoff]
 
     # Highlight dates in the next 14 days
     two_weeks = today + pd.Timedelta(days=14)
 
-    def style_upcoming(val):
-        try:
-            d = pd.to_datetime(val)
-            if d <= two_weeks:
-                return "color: #ff9800; font-weight: bold"
-        except Exception:
-            pass
-        return ""
+    def style_upcoming(col):
+        return np.where(col <= two_weeks, "color: #ff9800; font-weight: bold", "")
 
-    styled = earnings_display.style.map(style_upcoming, subset=["Earnings Date"])
+    styled = earnings_display.style.apply(
+        style_upcoming, subset=["Earnings Date"]
+    ).format({"Earnings Date": "{:%Y-%m-%d}"})
     st.dataframe(styled, use_container_width=True, hide_index=True)
 else:
     st.info("No earnings data. Run `python3 main.py` to fetch.")
@@ -72,20 +71,19 @@ if not news_df.empty:
     # Filters
     col1, col2 = st.columns(2)
     with col1:
-        sector_options = ["All"] + sorted(set(SECTORS.values()))
+        sector_options = ["All"] + sorted(SECTOR_NAMES)
         sector_filter = st.selectbox("Sector", sector_options)
+    sector_tickers = SECTOR_TO_TICKERS.get(sector_filter, [])
     with col2:
         if sector_filter == "All":
             available = sorted(news_df["ticker"].unique())
         else:
-            sector_tickers = [t for t, s in SECTORS.items() if s == sector_filter]
             available = sorted([t for t in news_df["ticker"].unique() if t in sector_tickers])
         ticker_options = ["All stocks"] + available
         ticker_filter = st.selectbox("Ticker", ticker_options)
 
     filtered = news_df.copy()
     if sector_filter != "All":
-        sector_tickers = [t for t, s in SECTORS.items() if s == sector_filter]
         filtered = filtered[filtered["ticker"].isin(sector_tickers)]
     if ticker_filter != "All stocks":
         filtered = filtered[filtered["ticker"] == ticker_filter]
@@ -98,11 +96,11 @@ if not news_df.empty:
         display.columns = ["Ticker", "Name", "Published", "Title", "Source", "Link"]
 
         # Show as markdown cards for better readability
-        for _, row in display.head(50).iterrows():
-            link_text = f"[{row['Title']}]({row['Link']})" if row["Link"] else row["Title"]
-            source_tag = f" — *{row['Source']}*" if row["Source"] else ""
+        for row in display.head(50).itertuples(index=False):
+            link_text = f"[{row.Title}]({row.Link})" if row.Link else row.Title
+            source_tag = f" — *{row.Source}*" if row.Source else ""
             st.markdown(
-                f"**{row['Ticker']}** | {row['Published']}{source_tag}  \n"
+                f"**{row.Ticker}** | {row.Published}{source_tag}  \n"
                 f"{link_text}"
             )
         if len(display) > 50:
@@ -1,10 +1,12 @@
 """Page 9: Macro Dashboard — BoC rate, FRED economic series, and macro context."""
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
 from data.database import get_macro, init_db
+from dashboard.components.charts import downsample_lttb
 from dashboard.components.styles import apply_custom_css
 from config import FRED_SERIES
 
@@ -22,8 +24,16 @@ ALL_MACRO = {
 
 
 @st.cache_data(ttl=300)
-def load_macro(series_id):
-    return get_macro(series_id)
+def load_all_macro():
+    """Load every tracked series in one query, keyed by series id (empty frame if missing)."""
+    df = get_macro()
+    frames = {} if df.empty else {
+        sid: g.reset_index(drop=True) for sid, g in df.groupby("series_id", sort=False)
+    }
+    return {sid: frames.get(sid, df.iloc[:0]) for sid in ALL_MACRO}
+
+
+macros = load_all_macro()
 
 
 # --- Summary metrics ---
@@ -31,7 +41,7 @@ st.subheader("Current Values")
 
 cols = st.columns(len(ALL_MACRO))
 for i, (series_id, name) in enumerate(ALL_MACRO.items()):
-    df = load_macro(series_id)
+    df = macros[series_id]
     if not df.empty:
         latest = df.iloc[-1]
         val = latest["value"]
@@ -78,15 +88,16 @@ colors = {
 }
 
 for series_id, name in ALL_MACRO.items():
-    df = load_macro(series_id)
+    df = macros[series_id]
     if df.empty:
         continue
 
-    df = df.sort_values("date").tail(n_days)
+    df = df.iloc[-n_days:]  # already ordered by date in SQL
 
     fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=df["date"], y=df["value"],
+    dates, values = downsample_lttb(df["date"], df["value"])
+    fig.add_trace(go.Scattergl(
+        x=dates, y=values,
         mode="lines",
         name=name,
         line=dict(color=colors.get(series_id, "#ffffff"), width=2),
@@ -117,18 +128,19 @@ for series_id, name in ALL_MACRO.items():
 # --- Overlay: BoC rate vs Bank stocks ---
 st.subheader("BoC Rate vs Bank Stock Performance")
 
-boc_df = load_macro("BOC_OVERNIGHT")
+boc_df = macros["BOC_OVERNIGHT"]
 if not boc_df.empty:
-    from data.database import get_prices
+    from data.database import get_prices_bulk
     from config import BANKS
 
-    boc_df = boc_df.sort_values("date").tail(n_days)
+    boc_df = boc_df.iloc[-n_days:]
 
     fig2 = go.Figure()
 
     # BoC rate on secondary y-axis
-    fig2.add_trace(go.Scatter(
-        x=boc_df["date"], y=boc_df["value"],
+    dates, values = downsample_lttb(boc_df["date"], boc_df["value"])
+    fig2.add_trace(go.Scattergl(
+        x=dates, y=values,
         mode="lines",
         name="BoC Overnight Rate (%)",
         line=dict(color="#ff9800", width=3),
@@ -138,19 +150,27 @@ if not boc_df.empty:
     # Normalized bank stock prices
     bank_colors = ["#2196f3", "#4caf50", "#e91e63", "#9c27b0",
                    "#00bcd4", "#ffeb3b", "#ff5722", "#795548"]
-    min_date = boc_df["date"].min()
+    min_date = np.datetime64(boc_df["date"].min())
+    bank_windows = {}
+    bank_prices = get_prices_bulk(list(BANKS))
+    if bank_prices:
+        # Dates are sorted, so binary-search the start of the BoC window per bank,
+        # then rebase every clipped bank to 100 in one grouped pass
+        banks = pd.concat([
+            stock_df.iloc[max(stock_df["date"].to_numpy().searchsorted(min_date), len(stock_df) - n_days):]
+            for stock_df in bank_prices.values()
+        ], ignore_index=True)
+        first_close = banks.groupby("ticker", sort=False)["close"].transform("first")
+        banks = banks.assign(normalized=banks["close"] / first_close * 100)
+        bank_windows = dict(tuple(banks.groupby("ticker", sort=False)))
+
     for i, (ticker, name) in enumerate(BANKS.items()):
-        stock_df = get_prices(ticker)
-        if stock_df.empty:
-            continue
-        stock_df = stock_df.sort_values("date")
-        stock_df = stock_df[stock_df["date"] >= min_date].tail(n_days)
-        if stock_df.empty:
+        stock_df = bank_windows.get(ticker)
+        if stock_df is None:
             continue
-        base = stock_df.iloc[0]["close"]
-        stock_df["normalized"] = stock_df["close"] / base * 100
-        fig2.add_trace(go.Scatter(
-            x=stock_df["date"], y=stock_df["normalized"],
+        dates, normalized = downsample_lttb(stock_df["date"], stock_df["normalized"])
+        fig2.add_trace(go.Scattergl(
+            x=dates, y=normalized,
             mode="lines",
             name=f"{ticker}",
             line=dict(color=bank_colors[i % len(bank_colors)], width=1.5),
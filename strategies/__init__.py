@@ -1,108 +1,103 @@
 """Signal detection strategies package."""
 
+from functools import lru_cache
+from importlib import import_module
+
 import pandas as pd
 
 from config import (
-    ATR_BREAKOUT_MULT, ADX_TREND_THRESHOLD, OBV_EMA_PERIOD,
+    ATR_BREAKOUT_MULT, ADX_TREND_THRESHOLD,
     STOCH_OVERSOLD, STOCH_OVERBOUGHT,
 )
-from strategies.ma_crossover import (
-    golden_death_cross,
-    ema_10_50_crossover,
-    ema_5_20_crossover,
-    vwap_crossover,
-)
-from strategies.rsi_strategy import (
-    rsi_oversold_overbought,
-    rsi_midline_cross,
-    macd_crossover,
+from strategies._common import column_array, cross_up, cross_down, previous
+from strategies.obv_strategy import obv_signal_line
+
+__all__ = ["BACKTEST_STRATEGIES", "signal_detectors", "detect_all_signals"]
+
+# (module, function) for each signal detector, in emission order. The modules are
+# imported on first detection so importing BACKTEST_STRATEGIES stays light.
+_DETECTOR_SPECS = (
+    ("strategies.ma_crossover", "golden_death_cross"),
+    ("strategies.ma_crossover", "ema_10_50_crossover"),
+    ("strategies.ma_crossover", "ema_5_20_crossover"),
+    ("strategies.ma_crossover", "vwap_crossover"),
+    ("strategies.rsi_strategy", "rsi_oversold_overbought"),
+    ("strategies.rsi_strategy", "rsi_midline_cross"),
+    ("strategies.rsi_strategy", "macd_crossover"),
+    ("strategies.combined_signals", "combined_momentum"),
+    ("strategies.bollinger_strategy", "bollinger_signals"),
+    ("strategies.atr_strategy", "atr_breakout_signals"),
+    ("strategies.adx_strategy", "adx_di_cross_signals"),
+    ("strategies.obv_strategy", "obv_trend_signals"),
+    ("strategies.stochastic_strategy", "stochastic_signals"),
 )
-from strategies.combined_signals import combined_momentum
-from strategies.bollinger_strategy import bollinger_signals
-from strategies.atr_strategy import atr_breakout_signals
-from strategies.adx_strategy import adx_di_cross_signals
-from strategies.obv_strategy import obv_trend_signals
-from strategies.stochastic_strategy import stochastic_signals
+
+
+@lru_cache(maxsize=None)
+def signal_detectors() -> tuple:
+    """Detector callables, importing their modules on first use."""
+    return tuple(getattr(import_module(module), name) for module, name in _DETECTOR_SPECS)
 
 
 def detect_all_signals(df: pd.DataFrame, ticker: str) -> list[dict]:
     """Run all signal detection strategies on indicator-enriched DataFrame."""
     all_signals = []
-    all_signals.extend(golden_death_cross(df, ticker))
-    all_signals.extend(ema_10_50_crossover(df, ticker))
-    all_signals.extend(ema_5_20_crossover(df, ticker))
-    all_signals.extend(vwap_crossover(df, ticker))
-    all_signals.extend(rsi_oversold_overbought(df, ticker))
-    all_signals.extend(rsi_midline_cross(df, ticker))
-    all_signals.extend(macd_crossover(df, ticker))
-    all_signals.extend(combined_momentum(df, ticker))
-    all_signals.extend(bollinger_signals(df, ticker))
-    all_signals.extend(atr_breakout_signals(df, ticker))
-    all_signals.extend(adx_di_cross_signals(df, ticker))
-    all_signals.extend(obv_trend_signals(df, ticker))
-    all_signals.extend(stochastic_signals(df, ticker))
+    for detector in signal_detectors():
+        all_signals.extend(detector(df, ticker))
     return all_signals
 
 
 # Strategy definitions for backtesting: maps strategy name to (entry_func, exit_func)
 # Each func takes DataFrame and returns boolean Series for entry/exit days.
 
+def _cross_up(df: pd.DataFrame, a, b) -> pd.Series:
+    """True where `a` moves from <= `b` to > `b` (names, Series or scalar `b`)."""
+    return pd.Series(cross_up(column_array(df, a), column_array(df, b)), index=df.index)
+
+
+def _cross_down(df: pd.DataFrame, a, b) -> pd.Series:
+    """True where `a` moves from >= `b` to < `b` (names, Series or scalar `b`)."""
+    return pd.Series(cross_down(column_array(df, a), column_array(df, b)), index=df.index)
+
+
 def _ema_10_50_entry(df: pd.DataFrame) -> pd.Series:
-    prev = df["ema_10"].shift(1)
-    prev_slow = df["ema_50"].shift(1)
-    return (prev <= prev_slow) & (df["ema_10"] > df["ema_50"])
+    return _cross_up(df, "ema_10", "ema_50")
 
 
 def _ema_10_50_exit(df: pd.DataFrame) -> pd.Series:
-    prev = df["ema_10"].shift(1)
-    prev_slow = df["ema_50"].shift(1)
-    return (prev >= prev_slow) & (df["ema_10"] < df["ema_50"])
+    return _cross_down(df, "ema_10", "ema_50")
 
 
 def _ema_5_20_entry(df: pd.DataFrame) -> pd.Series:
-    prev = df["ema_5"].shift(1)
-    prev_slow = df["ema_20"].shift(1)
-    return (prev <= prev_slow) & (df["ema_5"] > df["ema_20"])
+    return _cross_up(df, "ema_5", "ema_20")
 
 
 def _ema_5_20_exit(df: pd.DataFrame) -> pd.Series:
-    prev = df["ema_5"].shift(1)
-    prev_slow = df["ema_20"].shift(1)
-    return (prev >= prev_slow) & (df["ema_5"] < df["ema_20"])
+    return _cross_down(df, "ema_5", "ema_20")
 
 
 def _rsi_entry(df: pd.DataFrame) -> pd.Series:
-    prev = df["rsi_14"].shift(1)
-    return (prev <= 30) & (df["rsi_14"] > 30)
+    return _cross_up(df, "rsi_14", 30)
 
 
 def _rsi_exit(df: pd.DataFrame) -> pd.Series:
-    prev = df["rsi_14"].shift(1)
-    return (prev >= 70) & (df["rsi_14"] < 70)
+    return _cross_down(df, "rsi_14", 70)
 
 
 def _macd_entry(df: pd.DataFrame) -> pd.Series:
-    prev_macd = df["macd"].shift(1)
-    prev_sig = df["macd_signal"].shift(1)
-    return (prev_macd <= prev_sig) & (df["macd"] > df["macd_signal"])
+    return _cross_up(df, "macd", "macd_signal")
 
 
 def _macd_exit(df: pd.DataFrame) -> pd.Series:
-    prev_macd = df["macd"].shift(1)
-    prev_sig = df["macd_signal"].shift(1)
-    return (prev_macd >= prev_sig) & (df["macd"] < df["macd_signal"])
+    return _cross_down(df, "macd", "macd_signal")
 
 
 def _vwap_entry(df: pd.DataFrame) -> pd.Series:
-    prev_close = df["Close"].shift(1)
-    prev_vwap = df["vwap_20"].shift(1)
-    return (prev_close <= prev_vwap) & (df["Close"] > df["vwap_20"])
+    return _cross_up(df, "Close", "vwap_20")
 
 
 def _vwap_exit(df: pd.DataFrame) -> pd.Series:
-    prev_close = df["Close"].shift(1)
-    prev_vwap = df["vwap_20"].shift(1)
-    return (prev_close >= prev_vwap) & (df["Close"] < df["vwap_20"])
+    return _cross_down(df, "Close", "vwap_20")
 
 
 def _combined_entry(df: pd.DataFrame) -> pd.Series:
@@ -128,67 +123,52 @@ def _combined_exit(df: pd.DataFrame) -> pd.Series:
 # --- New strategy entry/exit functions ---
 
 def _bb_entry(df: pd.DataFrame) -> pd.Series:
-    prev_close = df["Close"].shift(1)
-    prev_lower = df["bb_lower"].shift(1)
-    return (prev_close <= prev_lower) & (df["Close"] > df["bb_lower"])
+    return _cross_up(df, "Close", "bb_lower")
 
 
 def _bb_exit(df: pd.DataFrame) -> pd.Series:
-    prev_close = df["Close"].shift(1)
-    prev_upper = df["bb_upper"].shift(1)
-    return (prev_close >= prev_upper) & (df["Close"] < df["bb_upper"])
+    return _cross_down(df, "Close", "bb_upper")
+
+
+def _atr_bands(df: pd.DataFrame) -> tuple:
+    close = column_array(df, "Close")
+    prev_close = previous(close)
+    prev_atr = previous(column_array(df, "atr_14"))
+    return close, prev_close + ATR_BREAKOUT_MULT * prev_atr, prev_close - ATR_BREAKOUT_MULT * prev_atr
 
 
 def _atr_entry(df: pd.DataFrame) -> pd.Series:
-    prev_close = df["Close"].shift(1)
-    prev_atr = df["atr_14"].shift(1)
-    return df["Close"] > (prev_close + ATR_BREAKOUT_MULT * prev_atr)
+    close, upper, _ = _atr_bands(df)
+    return pd.Series(close > upper, index=df.index)
 
 
 def _atr_exit(df: pd.DataFrame) -> pd.Series:
-    prev_close = df["Close"].shift(1)
-    prev_atr = df["atr_14"].shift(1)
-    return df["Close"] < (prev_close - ATR_BREAKOUT_MULT * prev_atr)
+    close, _, lower = _atr_bands(df)
+    return pd.Series(close < lower, index=df.index)
 
 
 def _adx_entry(df: pd.DataFrame) -> pd.Series:
-    prev_plus = df["plus_di"].shift(1)
-    prev_minus = df["minus_di"].shift(1)
-    return ((prev_plus <= prev_minus) & (df["plus_di"] > df["minus_di"])
-            & (df["adx_14"] > ADX_TREND_THRESHOLD))
+    return _cross_up(df, "plus_di", "minus_di") & (df["adx_14"] > ADX_TREND_THRESHOLD)
 
 
 def _adx_exit(df: pd.DataFrame) -> pd.Series:
-    prev_plus = df["plus_di"].shift(1)
-    prev_minus = df["minus_di"].shift(1)
-    return ((prev_minus <= prev_plus) & (df["minus_di"] > df["plus_di"])
-            & (df["adx_14"] > ADX_TREND_THRESHOLD))
+    return _cross_up(df, "minus_di", "plus_di") & (df["adx_14"] > ADX_TREND_THRESHOLD)
 
 
 def _obv_entry(df: pd.DataFrame) -> pd.Series:
-    obv_ema = df["obv"].ewm(span=OBV_EMA_PERIOD, adjust=False).mean()
-    prev_obv = df["obv"].shift(1)
-    prev_ema = obv_ema.shift(1)
-    return (prev_obv <= prev_ema) & (df["obv"] > obv_ema)
+    return _cross_up(df, "obv", obv_signal_line(df))
 
 
 def _obv_exit(df: pd.DataFrame) -> pd.Series:
-    obv_ema = df["obv"].ewm(span=OBV_EMA_PERIOD, adjust=False).mean()
-    prev_obv = df["obv"].shift(1)
-    prev_ema = obv_ema.shift(1)
-    return (prev_obv >= prev_ema) & (df["obv"] < obv_ema)
+    return _cross_down(df, "obv", obv_signal_line(df))
 
 
 def _stoch_entry(df: pd.DataFrame) -> pd.Series:
-    prev_k = df["stoch_k"].shift(1)
-    prev_d = df["stoch_d"].shift(1)
-    return (prev_k <= prev_d) & (df["stoch_k"] > df["stoch_d"]) & (prev_k < STOCH_OVERSOLD)
+    return _cross_up(df, "stoch_k", "stoch_d") & (previous(column_array(df, "stoch_k")) < STOCH_OVERSOLD)
 
 
 def _stoch_exit(df: pd.DataFrame) -> pd.Series:
-    prev_k = df["stoch_k"].shift(1)
-    prev_d = df["stoch_d"].shift(1)
-    return (prev_k >= prev_d) & (df["stoch_k"] < df["stoch_d"]) & (prev_k > STOCH_OVERBOUGHT)
+    return _cross_down(df, "stoch_k", "stoch_d") & (previous(column_array(df, "stoch_k")) > STOCH_OVERBOUGHT)
 
 
 BACKTEST_STRATEGIES = {
@@ -0,0 +1,91 @@
+"""Helpers shared by the signal strategy modules."""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+def column_array(df: pd.DataFrame, x) -> np.ndarray:
+    """Column name, Series/array or scalar as a float array aligned with df."""
+    if isinstance(x, str):
+        x = df[x]
+    return np.broadcast_to(np.asarray(x, dtype=float), (len(df),))
+
+
+def previous(a: np.ndarray) -> np.ndarray:
+    """`a` lagged by one row (NaN first), the ndarray counterpart of shift(1)."""
+    out = np.empty(len(a), dtype=float)
+    out[0:1] = np.nan
+    out[1:] = a[:-1]
+    return out
+
+
+def cross_up(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """True where `a` moves from <= `b` to > `b`; row 0 never crosses."""
+    out = np.zeros(len(a), dtype=bool)
+    np.less_equal(a[:-1], b[:-1], out=out[1:])
+    out[1:] &= a[1:] > b[1:]
+    return out
+
+
+def cross_down(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """True where `a` moves from >= `b` to < `b`; row 0 never crosses."""
+    out = np.zeros(len(a), dtype=bool)
+    np.greater_equal(a[:-1], b[:-1], out=out[1:])
+    out[1:] &= a[1:] < b[1:]
+    return out
+
+
+def cross_up_at(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row positions where cross_up(a, b) is True, without building the full mask.
+
+    Only rows already above `b` are candidates; the previous-row check runs on those alone.
+    """
+    idx = np.flatnonzero(a[1:] > b[1:]) + 1
+    return idx[a[idx - 1] <= b[idx - 1]]
+
+
+def cross_down_at(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row positions where cross_down(a, b) is True, without building the full mask."""
+    idx = np.flatnonzero(a[1:] < b[1:]) + 1
+    return idx[a[idx - 1] >= b[idx - 1]]
+
+
+def emit_signals(bull_idx: np.ndarray, bear_idx: np.ndarray, dates: pd.Index, closes: np.ndarray,
+                 ticker: str, bullish_type: str, bearish_type: str, strategy: str) -> list[dict]:
+    """One signal dict per bullish row position, then per bearish one, built in a single pass."""
+    idx = np.concatenate((bull_idx, bear_idx))
+    kinds = ((bullish_type, "bullish"), (bearish_type, "bearish"))
+    tags = [0] * len(bull_idx) + [1] * len(bear_idx)
+    return [
+        {"ticker": ticker, "date": date, "signal_type": kinds[tag][0],
+         "direction": kinds[tag][1], "price": price, "strategy": strategy}
+        for date, price, tag in zip(dates[idx], closes[idx], tags)
+    ]
+
+
+@dataclass(frozen=True)
+class CrossoverSpec:
+    """A "fast crosses slow" detector: columns or fixed levels plus the labels it emits."""
+    fast: str
+    slow: str | float
+    bullish_type: str
+    bearish_type: str
+    strategy: str
+    bearish_slow: str | float | None = None  # level for the bearish cross when it differs
+
+
+def run_crossover(df: pd.DataFrame, ticker: str, spec: CrossoverSpec) -> list[dict]:
+    """Bullish where `fast` crosses above `slow`, bearish where it crosses back below."""
+    bearish_slow = spec.slow if spec.bearish_slow is None else spec.bearish_slow
+    if not all(x in df.columns for x in (spec.fast, spec.slow, bearish_slow) if isinstance(x, str)):
+        return []
+
+    fast = column_array(df, spec.fast)
+    bullish = cross_up_at(fast, column_array(df, spec.slow))
+    bearish = cross_down_at(fast, column_array(df, bearish_slow))
+    return emit_signals(
+        bullish, bearish, df.index, df["Close"].to_numpy(), ticker,
+        spec.bullish_type, spec.bearish_type, spec.strategy,
+    )
@@ -3,6 +3,7 @@
 import pandas as pd
 
 from config import ADX_TREND_THRESHOLD
+from strategies._common import column_array, cross_up_at, emit_signals
 
 
 def adx_di_cross_signals(df: pd.DataFrame, ticker: str) -> list[dict]:
@@ -10,29 +11,20 @@ def adx_di_cross_signals(df: pd.DataFrame, ticker: str) -> list[dict]:
     if "adx_14" not in df.columns or "plus_di" not in df.columns or "minus_di" not in df.columns:
         return []
 
-    signals = []
-    prev_plus = df["plus_di"].shift(1)
-    prev_minus = df["minus_di"].shift(1)
-    strong_trend = df["adx_14"] > ADX_TREND_THRESHOLD
+    closes = df["Close"].to_numpy()
+    plus_di = column_array(df, "plus_di")
+    minus_di = column_array(df, "minus_di")
+    adx = column_array(df, "adx_14")
 
     # Bullish: +DI crosses above -DI with ADX > 20
-    bullish = (prev_plus <= prev_minus) & (df["plus_di"] > df["minus_di"]) & strong_trend
-    for date, row in df[bullish].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date,
-            "signal_type": "ADX +DI Bullish Cross",
-            "direction": "bullish", "price": row["Close"],
-            "strategy": "ADX DI Cross",
-        })
+    bullish = cross_up_at(plus_di, minus_di)
+    bullish = bullish[adx[bullish] > ADX_TREND_THRESHOLD]
 
     # Bearish: -DI crosses above +DI with ADX > 20
-    bearish = (prev_minus <= prev_plus) & (df["minus_di"] > df["plus_di"]) & strong_trend
-    for date, row in df[bearish].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date,
-            "signal_type": "ADX -DI Bearish Cross",
-            "direction": "bearish", "price": row["Close"],
-            "strategy": "ADX DI Cross",
-        })
-
-    return signals
+    bearish = cross_up_at(minus_di, plus_di)
+    bearish = bearish[adx[bearish] > ADX_TREND_THRESHOLD]
+
+    return emit_signals(
+        bullish, bearish, df.index, closes, ticker,
+        "ADX +DI Bullish Cross", "ADX -DI Bearish Cross", "ADX DI Cross",
+    )
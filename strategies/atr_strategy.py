@@ -1,8 +1,10 @@
 """ATR Breakout signal strategy."""
 
+import numpy as np
 import pandas as pd
 
 from config import ATR_BREAKOUT_MULT
+from strategies._common import column_array, emit_signals, previous
 
 
 def atr_breakout_signals(df: pd.DataFrame, ticker: str) -> list[dict]:
@@ -10,28 +12,18 @@ def atr_breakout_signals(df: pd.DataFrame, ticker: str) -> list[dict]:
     if "atr_14" not in df.columns:
         return []
 
-    signals = []
-    prev_close = df["Close"].shift(1)
-    prev_atr = df["atr_14"].shift(1)
+    closes = df["Close"].to_numpy()
+    close = column_array(df, "Close")
+    prev_close = previous(close)
+    prev_atr = previous(column_array(df, "atr_14"))
 
     # Bullish: close > prev_close + mult * ATR
-    bullish = df["Close"] > (prev_close + ATR_BREAKOUT_MULT * prev_atr)
-    for date, row in df[bullish].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date,
-            "signal_type": "ATR Breakout Up",
-            "direction": "bullish", "price": row["Close"],
-            "strategy": "ATR Breakout",
-        })
+    bullish = np.flatnonzero(close > (prev_close + ATR_BREAKOUT_MULT * prev_atr))
 
     # Bearish: close < prev_close - mult * ATR
-    bearish = df["Close"] < (prev_close - ATR_BREAKOUT_MULT * prev_atr)
-    for date, row in df[bearish].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date,
-            "signal_type": "ATR Breakdown",
-            "direction": "bearish", "price": row["Close"],
-            "strategy": "ATR Breakout",
-        })
-
-    return signals
+    bearish = np.flatnonzero(close < (prev_close - ATR_BREAKOUT_MULT * prev_atr))
+
+    return emit_signals(
+        bullish, bearish, df.index, closes, ticker,
+        "ATR Breakout Up", "ATR Breakdown", "ATR Breakout",
+    )
@@ -1,8 +1,17 @@
 """Combined multi-indicator signal strategies."""
 
+import numpy as np
 import pandas as pd
 
 from config import RSI_OVERSOLD, RSI_OVERBOUGHT
+from strategies._common import emit_signals
+
+
+def _rising_edge(cond: np.ndarray) -> np.ndarray:
+    """True where `cond` is set and was not set the day before (the first row counts)."""
+    edge = cond.copy()
+    edge[1:] &= ~cond[:-1]
+    return edge
 
 
 def combined_momentum(df: pd.DataFrame, ticker: str) -> list[dict]:
@@ -17,38 +26,32 @@ def combined_momentum(df: pd.DataFrame, ticker: str) -> list[dict]:
     if not all(col in df.columns for col in required):
         return []
 
-    signals = []
-
-    bullish_cond = (
-        (df["ema_10"] > df["ema_50"])
-        & (df["rsi_14"] > 50)
-        & (df["rsi_14"] < RSI_OVERBOUGHT)
-        & (df["macd_histogram"] > 0)
-        & (df["Close"] > df["vwap_20"])
+    ema_10, ema_50, rsi, hist, closes, vwap = (
+        df[col].to_numpy(dtype=float)
+        for col in ("ema_10", "ema_50", "rsi_14", "macd_histogram", "Close", "vwap_20")
     )
 
-    bearish_cond = (
-        (df["ema_10"] < df["ema_50"])
-        & (df["rsi_14"] < 50)
-        & (df["rsi_14"] > RSI_OVERSOLD)
-        & (df["macd_histogram"] < 0)
-        & (df["Close"] < df["vwap_20"])
-    )
+    # Fold each comparison into the running condition through one reused scratch
+    # buffer instead of allocating a temporary per term and per `&`.
+    scratch = np.empty(len(df), dtype=bool)
+
+    bullish_cond = ema_10 > ema_50
+    bullish_cond &= np.greater(rsi, 50, out=scratch)
+    bullish_cond &= np.less(rsi, RSI_OVERBOUGHT, out=scratch)
+    bullish_cond &= np.greater(hist, 0, out=scratch)
+    bullish_cond &= np.greater(closes, vwap, out=scratch)
+
+    bearish_cond = ema_10 < ema_50
+    bearish_cond &= np.less(rsi, 50, out=scratch)
+    bearish_cond &= np.greater(rsi, RSI_OVERSOLD, out=scratch)
+    bearish_cond &= np.less(hist, 0, out=scratch)
+    bearish_cond &= np.less(closes, vwap, out=scratch)
 
     # Only trigger on transition (previous day was NOT aligned)
-    bull_transition = bullish_cond & ~bullish_cond.shift(1, fill_value=False)
-    bear_transition = bearish_cond & ~bearish_cond.shift(1, fill_value=False)
-
-    for date, row in df[bull_transition].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date, "signal_type": "Combined Momentum Bullish",
-            "direction": "bullish", "price": row["Close"], "strategy": "Combined",
-        })
-
-    for date, row in df[bear_transition].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date, "signal_type": "Combined Momentum Bearish",
-            "direction": "bearish", "price": row["Close"], "strategy": "Combined",
-        })
-
-    return signals
+    bull_transition = np.flatnonzero(_rising_edge(bullish_cond))
+    bear_transition = np.flatnonzero(_rising_edge(bearish_cond))
+
+    return emit_signals(
+        bull_transition, bear_transition, df.index, closes, ticker,
+        "Combined Momentum Bullish", "Combined Momentum Bearish", "Combined",
+    )
@@ -1,15 +1,15 @@
 """Moving average crossover signal strategies."""
 
+import numpy as np
 import pandas as pd
 
+from strategies._common import (
+    CrossoverSpec, column_array, cross_down_at, cross_up_at, emit_signals, run_crossover,
+)
 
-def _crossover(fast: pd.Series, slow: pd.Series) -> tuple[pd.Series, pd.Series]:
-    """Detect crossover points. Returns (bullish_cross, bearish_cross) boolean Series."""
-    prev_fast = fast.shift(1)
-    prev_slow = slow.shift(1)
-    bullish = (prev_fast <= prev_slow) & (fast > slow)
-    bearish = (prev_fast >= prev_slow) & (fast < slow)
-    return bullish, bearish
+EMA_10_50 = CrossoverSpec("ema_10", "ema_50", "EMA 10/50 Bullish Cross", "EMA 10/50 Bearish Cross", "MA Crossover")
+EMA_5_20 = CrossoverSpec("ema_5", "ema_20", "EMA 5/20 Bullish Cross", "EMA 5/20 Bearish Cross", "MA Crossover")
+VWAP = CrossoverSpec("Close", "vwap_20", "VWAP Bullish Cross", "VWAP Bearish Cross", "VWAP")
 
 
 def golden_death_cross(df: pd.DataFrame, ticker: str) -> list[dict]:
@@ -20,88 +20,33 @@ def golden_death_cross(df: pd.DataFrame, ticker: str) -> list[dict]:
     if "sma_50" not in df.columns or "sma_200" not in df.columns:
         return []
 
-    signals = []
-    bullish, bearish = _crossover(df["sma_50"], df["sma_200"])
+    closes = df["Close"].to_numpy()
+    sma_50 = column_array(df, "sma_50")
+    sma_200 = column_array(df, "sma_200")
 
-    for date, row in df[bullish].iterrows():
-        # Pullback filter: price within 3% of SMA 50
-        if abs(row["Close"] - row["sma_50"]) / row["sma_50"] <= 0.03:
-            signals.append({
-                "ticker": ticker, "date": date, "signal_type": "Golden Cross",
-                "direction": "bullish", "price": row["Close"], "strategy": "MA Crossover",
-            })
+    bullish = cross_up_at(sma_50, sma_200)
+    bearish = cross_down_at(sma_50, sma_200)
 
-    for date, row in df[bearish].iterrows():
-        if abs(row["Close"] - row["sma_50"]) / row["sma_50"] <= 0.03:
-            signals.append({
-                "ticker": ticker, "date": date, "signal_type": "Death Cross",
-                "direction": "bearish", "price": row["Close"], "strategy": "MA Crossover",
-            })
+    def pullback(idx):
+        # Pullback filter: price within 3% of SMA 50, checked on the crossover rows only
+        return idx[np.abs(closes[idx] - sma_50[idx]) / sma_50[idx] <= 0.03]
 
-    return signals
+    return emit_signals(
+        pullback(bullish), pullback(bearish), df.index, closes, ticker,
+        "Golden Cross", "Death Cross", "MA Crossover",
+    )
 
 
 def ema_10_50_crossover(df: pd.DataFrame, ticker: str) -> list[dict]:
     """EMA 10/50 crossover signals."""
-    if "ema_10" not in df.columns or "ema_50" not in df.columns:
-        return []
-
-    signals = []
-    bullish, bearish = _crossover(df["ema_10"], df["ema_50"])
-
-    for date, row in df[bullish].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date, "signal_type": "EMA 10/50 Bullish Cross",
-            "direction": "bullish", "price": row["Close"], "strategy": "MA Crossover",
-        })
-    for date, row in df[bearish].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date, "signal_type": "EMA 10/50 Bearish Cross",
-            "direction": "bearish", "price": row["Close"], "strategy": "MA Crossover",
-        })
-
-    return signals
+    return run_crossover(df, ticker, EMA_10_50)
 
 
 def ema_5_20_crossover(df: pd.DataFrame, ticker: str) -> list[dict]:
     """EMA 5/20 crossover signals (shorter-term)."""
-    if "ema_5" not in df.columns or "ema_20" not in df.columns:
-        return []
-
-    signals = []
-    bullish, bearish = _crossover(df["ema_5"], df["ema_20"])
-
-    for date, row in df[bullish].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date, "signal_type": "EMA 5/20 Bullish Cross",
-            "direction": "bullish", "price": row["Close"], "strategy": "MA Crossover",
-        })
-    for date, row in df[bearish].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date, "signal_type": "EMA 5/20 Bearish Cross",
-            "direction": "bearish", "price": row["Close"], "strategy": "MA Crossover",
-        })
-
-    return signals
+    return run_crossover(df, ticker, EMA_5_20)
 
 
 def vwap_crossover(df: pd.DataFrame, ticker: str) -> list[dict]:
     """Price crossing above/below VWAP signals."""
-    if "vwap_20" not in df.columns:
-        return []
-
-    signals = []
-    bullish, bearish = _crossover(df["Close"], df["vwap_20"])
-
-    for date, row in df[bullish].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date, "signal_type": "VWAP Bullish Cross",
-            "direction": "bullish", "price": row["Close"], "strategy": "VWAP",
-        })
-    for date, row in df[bearish].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date, "signal_type": "VWAP Bearish Cross",
-            "direction": "bearish", "price": row["Close"], "strategy": "VWAP",
-        })
-
-    return signals
+    return run_crossover(df, ticker, VWAP)
@@ -3,6 +3,14 @@
 import pandas as pd
 
 from config import OBV_EMA_PERIOD
+from strategies._common import column_array, cross_down_at, cross_up_at, emit_signals
+
+
+def obv_signal_line(df: pd.DataFrame) -> pd.Series:
+    """OBV EMA, reusing the precomputed `obv_ema` column when the indicators provide it."""
+    if "obv_ema" in df.columns:
+        return df["obv_ema"]
+    return df["obv"].ewm(span=OBV_EMA_PERIOD, adjust=False).mean()
 
 
 def obv_trend_signals(df: pd.DataFrame, ticker: str) -> list[dict]:
@@ -10,29 +18,17 @@ def obv_trend_signals(df: pd.DataFrame, ticker: str) -> list[dict]:
     if "obv" not in df.columns:
         return []
 
-    signals = []
-    obv_ema = df["obv"].ewm(span=OBV_EMA_PERIOD, adjust=False).mean()
-    prev_obv = df["obv"].shift(1)
-    prev_ema = obv_ema.shift(1)
+    closes = df["Close"].to_numpy()
+    obv = column_array(df, "obv")
+    obv_ema = column_array(df, obv_signal_line(df))
 
     # Bullish: OBV crosses above its EMA
-    bullish = (prev_obv <= prev_ema) & (df["obv"] > obv_ema)
-    for date, row in df[bullish].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date,
-            "signal_type": "OBV Bullish Cross",
-            "direction": "bullish", "price": row["Close"],
-            "strategy": "OBV Trend",
-        })
+    bullish = cross_up_at(obv, obv_ema)
 
     # Bearish: OBV crosses below its EMA
-    bearish = (prev_obv >= prev_ema) & (df["obv"] < obv_ema)
-    for date, row in df[bearish].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date,
-            "signal_type": "OBV Bearish Cross",
-            "direction": "bearish", "price": row["Close"],
-            "strategy": "OBV Trend",
-        })
-
-    return signals
+    bearish = cross_down_at(obv, obv_ema)
+
+    return emit_signals(
+        bullish, bearish, df.index, closes, ticker,
+        "OBV Bullish Cross", "OBV Bearish Cross", "OBV Trend",
+    )
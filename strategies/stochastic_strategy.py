@@ -3,6 +3,7 @@
 import pandas as pd
 
 from config import STOCH_OVERSOLD, STOCH_OVERBOUGHT
+from strategies._common import column_array, cross_down_at, cross_up_at, emit_signals
 
 
 def stochastic_signals(df: pd.DataFrame, ticker: str) -> list[dict]:
@@ -10,28 +11,19 @@ def stochastic_signals(df: pd.DataFrame, ticker: str) -> list[dict]:
     if "stoch_k" not in df.columns or "stoch_d" not in df.columns:
         return []
 
-    signals = []
-    prev_k = df["stoch_k"].shift(1)
-    prev_d = df["stoch_d"].shift(1)
+    closes = df["Close"].to_numpy()
+    k = column_array(df, "stoch_k")
+    d = column_array(df, "stoch_d")
 
     # Bullish: %K crosses above %D while both are below oversold level
-    bullish = (prev_k <= prev_d) & (df["stoch_k"] > df["stoch_d"]) & (prev_k < STOCH_OVERSOLD)
-    for date, row in df[bullish].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date,
-            "signal_type": "Stochastic Bullish Cross",
-            "direction": "bullish", "price": row["Close"],
-            "strategy": "Stochastic",
-        })
+    bullish = cross_up_at(k, d)
+    bullish = bullish[k[bullish - 1] < STOCH_OVERSOLD]
 
     # Bearish: %K crosses below %D while both are above overbought level
-    bearish = (prev_k >= prev_d) & (df["stoch_k"] < df["stoch_d"]) & (prev_k > STOCH_OVERBOUGHT)
-    for date, row in df[bearish].iterrows():
-        signals.append({
-            "ticker": ticker, "date": date,
-            "signal_type": "Stochastic Bearish Cross",
-            "direction": "bearish", "price": row["Close"],
-            "strategy": "Stochastic",
-        })
-
-    return signals
+    bearish = cross_down_at(k, d)
+    bearish = bearish[k[bearish - 1] > STOCH_OVERBOUGHT]
+
+    return emit_signals(
+        bullish, bearish, df.index, closes, ticker,
+        "Stochastic Bullish Cross", "Stochastic Bearish Cross", "Stochastic",
+    )
@@ -0,0 +1,62 @@
+"""Shared fixtures for the test suite."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import calculate_all_indicators
+from strategies import detect_all_signals
+
+# Business-day indexes for the synthetic frames; DatetimeIndex is immutable, so they are built once
+_DATES_100 = pd.date_range("2024-01-01", periods=100, freq="B")
+_DATES_80 = pd.date_range("2024-01-01", periods=80, freq="B")
+
+_OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def _ohlcv_array(prices: np.ndarray) -> np.ndarray:
+    """One float64 (n, 5) block of OHLCV derived from closing prices, with flat 1M volume."""
+    arr = np.empty((len(prices), 5))
+    arr[:, 0] = prices
+    arr[:, 1] = prices * 1.01
+    arr[:, 2] = prices * 0.99
+    arr[:, 3] = prices
+    arr[:, 4] = 1_000_000
+    return arr
+
+
+def _build_df(prices: np.ndarray, dates: pd.DatetimeIndex) -> pd.DataFrame:
+    """Indicator-enriched OHLCV frame for a synthetic closing-price path."""
+    df = pd.DataFrame(_ohlcv_array(prices), index=dates, columns=_OHLCV_COLUMNS)
+    return calculate_all_indicators(df)
+
+
+def _crossover_prices() -> np.ndarray:
+    """Price drops then rises — EMA 5 crosses above EMA 20 midway through."""
+    prices_down = 100 - 0.5 * np.arange(50)
+    prices_up = prices_down[-1] + 0.8 * np.arange(50)
+    return np.concatenate([prices_down, prices_up])
+
+
+def _oversold_prices() -> np.ndarray:
+    """Flat, then a sharp drop into RSI oversold, then a steady recovery."""
+    prices = np.concatenate([np.full(20, 100.0), 100 - 3 * np.arange(20), 40 + 2 * np.arange(40)])
+    return np.maximum(prices, 5.0)
+
+
+@pytest.fixture(scope="session")
+def crossover_df():
+    """Indicator-enriched V-shaped prices, computed once per session. Tests must not mutate it."""
+    return _build_df(_crossover_prices(), _DATES_100)
+
+
+@pytest.fixture(scope="session")
+def oversold_df():
+    """Indicator-enriched drop-then-recover prices for the RSI tests. Tests must not mutate it."""
+    return _build_df(_oversold_prices(), _DATES_80)
+
+
+@pytest.fixture(scope="session")
+def all_signals(crossover_df):
+    """detect_all_signals output for the crossover frame, shared by read-only tests."""
+    return detect_all_signals(crossover_df, "TEST.TO")
@@ -0,0 +1,47 @@
+"""Tests for chart helpers."""
+
+import numpy as np
+import pandas as pd
+
+from dashboard.components.charts import downsample_lttb
+
+
+def make_series(n=1000):
+    """Random-walk prices on a business-day index."""
+    rng = np.random.default_rng(42)
+    dates = pd.date_range("2020-01-01", periods=n, freq="B")
+    prices = 100 + np.cumsum(rng.standard_normal(n))
+    return dates, prices
+
+
+class TestDownsampleLTTB:
+    def test_keeps_first_and_last_points(self):
+        dates, prices = make_series()
+        x, y = downsample_lttb(dates, prices, n_out=100)
+        assert x[0] == dates[0] and x[-1] == dates[-1]
+        assert y[0] == prices[0] and y[-1] == prices[-1]
+
+    def test_output_length_is_n_out(self):
+        dates, prices = make_series()
+        x, y = downsample_lttb(dates, prices, n_out=100)
+        assert len(x) == len(y) == 100
+
+    def test_short_series_passes_through(self):
+        dates, prices = make_series(50)
+        x, y = downsample_lttb(dates, prices, n_out=100)
+        np.testing.assert_array_equal(x, np.asarray(dates))
+        np.testing.assert_array_equal(y, prices)
+
+    def test_datetime_x_strictly_increasing(self):
+        dates, prices = make_series()
+        x, _ = downsample_lttb(dates, prices, n_out=100)
+        assert x.dtype.kind == "M"
+        assert (np.diff(x) > np.timedelta64(0)).all()
+
+    def test_global_extremes_survive(self):
+        dates, prices = make_series()
+        prices[400] = 500.0
+        prices[700] = -300.0
+        _, y = downsample_lttb(dates, prices, n_out=100)
+        assert y.max() == 500.0
+        assert y.min() == -300.0
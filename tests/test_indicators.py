@@ -6,7 +6,7 @@ import pytest
 
 from indicators.moving_averages import calculate_emas, calculate_smas
 from indicators.momentum import calculate_rsi, calculate_macd
-from indicators.volume import calculate_vwap
+from indicators.volume import calculate_vwap, calculate_obv
 from indicators import calculate_all_indicators
 
 
@@ -143,6 +143,16 @@ class TestVWAP:
         assert pd.isna(df["vwap_20"].iloc[0])
 
 
+class TestOBV:
+    def test_obv_skips_nan_volume(self):
+        """A missing Volume row should not wipe out OBV for the rest of the history."""
+        df = make_price_df([10.0, 11.0, 12.0, 11.0, 12.0, 13.0], volume=[1, 2, np.nan, 4, 5, 6])
+        df = calculate_obv(df)
+        np.testing.assert_array_equal(df["obv"].values, [0.0, 2.0, np.nan, -2.0, 3.0, 9.0])
+        assert df["obv"].dtype == np.float64
+        assert df["obv_ema"].notna().all()
+
+
 class TestCalculateAll:
     def test_all_columns_present(self):
         """calculate_all_indicators should add all expected columns."""
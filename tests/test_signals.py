@@ -4,132 +4,119 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from indicators import calculate_all_indicators
 from strategies.ma_crossover import (
     golden_death_cross, ema_10_50_crossover, ema_5_20_crossover, vwap_crossover,
 )
 from strategies.rsi_strategy import rsi_oversold_overbought, rsi_midline_cross, macd_crossover
 from strategies.combined_signals import combined_momentum
 from strategies import detect_all_signals
+from strategies._common import cross_down, cross_down_at, cross_up, cross_up_at
 
+REQUIRED_KEYS = ["ticker", "date", "signal_type", "direction", "price", "strategy"]
 
-def make_crossover_df():
-    """Create a DataFrame where EMA 5 crosses above EMA 20 midway through."""
-    n = 100
-    dates = pd.date_range("2024-01-01", periods=n, freq="B")
-    # Price drops then rises — creates a crossover scenario
-    prices_down = [100 - i * 0.5 for i in range(50)]
-    prices_up = [prices_down[-1] + i * 0.8 for i in range(50)]
-    prices = prices_down + prices_up
 
-    df = pd.DataFrame({
-        "Open": prices,
-        "High": [p * 1.01 for p in prices],
-        "Low": [p * 0.99 for p in prices],
-        "Close": prices,
-        "Volume": [1000000] * n,
-    }, index=dates)
+def signal_frame(signals: list[dict]) -> pd.DataFrame:
+    """Signals as a frame with one column per required key (NaN where a key is missing)."""
+    return pd.DataFrame.from_records(signals, columns=REQUIRED_KEYS)
 
-    return calculate_all_indicators(df)
+
+CROSS_CASES = {
+    # a crosses b upward at row 1 and downward at row 3
+    "early": (np.array([0.0, 2.0, 2.0, 0.0, 0.0]), np.array([1.0, 1.0, 1.0, 1.0, 1.0])),
+    # NaN on either side must never produce a cross
+    "nan": (np.array([0.0, np.nan, 2.0, 0.0, 2.0, np.nan]), np.array([1.0, 1.0, np.nan, 1.0, 1.0, 1.0])),
+    # touching the level counts as "not above/below yet"
+    "touch": (np.array([1.0, 2.0, 1.0, 0.0, 1.0, 2.0]), np.full(6, 1.0)),
+    "random": (np.random.default_rng(0).standard_normal(200), np.random.default_rng(1).standard_normal(200)),
+    "single": (np.array([1.0]), np.array([0.0])),
+    "empty": (np.array([]), np.array([])),
+}
+
+
+@pytest.mark.parametrize("case", CROSS_CASES)
+def test_cross_index_kernels_match_masks(case):
+    a, b = CROSS_CASES[case]
+    np.testing.assert_array_equal(cross_up_at(a, b), np.flatnonzero(cross_up(a, b)))
+    np.testing.assert_array_equal(cross_down_at(a, b), np.flatnonzero(cross_down(a, b)))
+
+
+def test_cross_at_first_rows():
+    a, b = CROSS_CASES["early"]
+    np.testing.assert_array_equal(cross_up_at(a, b), [1])
+    np.testing.assert_array_equal(cross_down_at(a, b), [3])
+
+
+@pytest.mark.parametrize("fn", [
+    golden_death_cross, ema_10_50_crossover, ema_5_20_crossover, vwap_crossover,
+    rsi_oversold_overbought, macd_crossover, rsi_midline_cross, combined_momentum,
+])
+def test_no_signals_on_missing_columns(fn):
+    """Every strategy should return an empty list if its indicator columns are missing."""
+    assert fn(pd.DataFrame({"Close": [100, 101, 102]}), "X") == []
 
 
 class TestMACrossover:
-    def test_ema_5_20_detects_signals(self):
+    def test_ema_5_20_detects_signals(self, crossover_df):
         """Should detect crossover signals on synthetic data."""
-        df = make_crossover_df()
+        df = crossover_df
         signals = ema_5_20_crossover(df, "TEST.TO")
         # Should have at least one signal (the V-shape creates crossovers)
         assert len(signals) > 0
         # Each signal should have required keys
-        for s in signals:
-            assert "ticker" in s
-            assert "date" in s
-            assert "signal_type" in s
-            assert "direction" in s
-            assert s["direction"] in ("bullish", "bearish")
-
-    def test_ema_10_50_structure(self):
-        df = make_crossover_df()
-        signals = ema_10_50_crossover(df, "TEST.TO")
-        for s in signals:
-            assert s["strategy"] == "MA Crossover"
-            assert s["ticker"] == "TEST.TO"
-
-    def test_golden_cross_pullback_filter(self):
+        sig_df = signal_frame(signals)
+        assert sig_df[["ticker", "date", "signal_type", "direction"]].notna().all().all()
+        assert sig_df["direction"].isin(["bullish", "bearish"]).all()
+
+    def test_ema_10_50_structure(self, crossover_df):
+        df = crossover_df
+        sig_df = signal_frame(ema_10_50_crossover(df, "TEST.TO"))
+        assert (sig_df["strategy"] == "MA Crossover").all()
+        assert (sig_df["ticker"] == "TEST.TO").all()
+
+    def test_golden_cross_pullback_filter(self, crossover_df):
         """Golden cross should filter signals where price is far from SMA 50."""
-        df = make_crossover_df()
-        signals = golden_death_cross(df, "TEST.TO")
+        df = crossover_df
+        sig_df = signal_frame(golden_death_cross(df, "TEST.TO"))
         # Signals may or may not fire depending on pullback filter
-        for s in signals:
-            assert s["signal_type"] in ("Golden Cross", "Death Cross")
+        assert sig_df["signal_type"].isin(["Golden Cross", "Death Cross"]).all()
 
-    def test_no_signals_on_missing_columns(self):
-        """Should return empty list if required columns are missing."""
-        df = pd.DataFrame({"Close": [100, 101, 102]})
-        assert golden_death_cross(df, "X") == []
-        assert ema_10_50_crossover(df, "X") == []
-
-    def test_vwap_crossover(self):
-        df = make_crossover_df()
-        signals = vwap_crossover(df, "TEST.TO")
-        for s in signals:
-            assert s["strategy"] == "VWAP"
+    def test_vwap_crossover(self, crossover_df):
+        df = crossover_df
+        sig_df = signal_frame(vwap_crossover(df, "TEST.TO"))
+        assert (sig_df["strategy"] == "VWAP").all()
 
 
 class TestRSISignals:
-    def test_rsi_oversold_recovery(self):
+    def test_rsi_oversold_recovery(self, oversold_df):
         """Simulate RSI dropping below 30 then recovering."""
-        # Create prices that drop sharply then recover
-        n = 80
-        dates = pd.date_range("2024-01-01", periods=n, freq="B")
-        prices = [100.0] * 20 + [100 - i * 3 for i in range(20)] + [40 + i * 2 for i in range(40)]
-        prices = [max(p, 5) for p in prices]
-
-        df = pd.DataFrame({
-            "Open": prices, "High": [p * 1.01 for p in prices],
-            "Low": [p * 0.99 for p in prices], "Close": prices,
-            "Volume": [1000000] * n,
-        }, index=dates)
-
-        df = calculate_all_indicators(df)
+        df = oversold_df
         signals = rsi_oversold_overbought(df, "TEST.TO")
 
         # Should detect at least the recovery from oversold
         bullish = [s for s in signals if s["direction"] == "bullish"]
         assert len(bullish) >= 0  # May or may not trigger depending on exact RSI values
 
-    def test_macd_crossover_signals(self):
-        df = make_crossover_df()
-        signals = macd_crossover(df, "TEST.TO")
-        for s in signals:
-            assert s["strategy"] == "MACD"
-            assert s["direction"] in ("bullish", "bearish")
+    def test_macd_crossover_signals(self, crossover_df):
+        df = crossover_df
+        sig_df = signal_frame(macd_crossover(df, "TEST.TO"))
+        assert (sig_df["strategy"] == "MACD").all()
+        assert sig_df["direction"].isin(["bullish", "bearish"]).all()
 
 
 class TestCombinedSignals:
-    def test_combined_requires_all_indicators(self):
-        """Combined signal should return empty if columns are missing."""
-        df = pd.DataFrame({"Close": [100]})
-        assert combined_momentum(df, "X") == []
-
-    def test_combined_on_full_data(self):
-        df = make_crossover_df()
-        signals = combined_momentum(df, "TEST.TO")
-        for s in signals:
-            assert s["strategy"] == "Combined"
+    def test_combined_on_full_data(self, crossover_df):
+        df = crossover_df
+        sig_df = signal_frame(combined_momentum(df, "TEST.TO"))
+        assert (sig_df["strategy"] == "Combined").all()
 
 
 class TestDetectAll:
-    def test_detect_all_returns_list(self):
-        df = make_crossover_df()
-        signals = detect_all_signals(df, "TEST.TO")
-        assert isinstance(signals, list)
+    def test_detect_all_returns_list(self, all_signals):
+        assert isinstance(all_signals, list)
         # Should detect some signals on the V-shaped data
-        assert len(signals) > 0
+        assert len(all_signals) > 0
 
-    def test_all_signals_have_required_keys(self):
-        df = make_crossover_df()
-        signals = detect_all_signals(df, "TEST.TO")
-        required_keys = {"ticker", "date", "signal_type", "direction", "price", "strategy"}
-        for s in signals:
-            assert required_keys.issubset(s.keys()), f"Missing keys in signal: {s}"
+    def test_all_signals_have_required_keys(self, all_signals):
+        sig_df = pd.DataFrame.from_records(all_signals)
+        assert set(sig_df.columns) >= set(REQUIRED_KEYS)
+        assert sig_df[REQUIRED_KEYS].notna().all().all()